@@ -84,6 +84,8 @@ class Client(_ClientCore):  # pylint: disable=too-many-public-methods
         timeout: HTTP request timeout in seconds.
         extra_headers: Extra headers to pass for HTTP request.
         proxy: Proxy URL to pass to the HTTP client.
+        http2: Use HTTP/2 when the endpoint supports it, so that concurrent requests share one connection.
+            Requires the ``http2`` extra (``pip install solana[http2]``).
     """
 
     def __init__(
@@ -93,10 +95,13 @@ class Client(_ClientCore):  # pylint: disable=too-many-public-methods
         timeout: float = 10,
         extra_headers: Optional[Dict[str, str]] = None,
         proxy: Optional[str] = None,
+        http2: bool = False,
     ):
         """Init API client."""
         super().__init__(commitment)
-        self._provider = http.HTTPProvider(endpoint, timeout=timeout, extra_headers=extra_headers, proxy=proxy)
+        self._provider = http.HTTPProvider(
+            endpoint, timeout=timeout, extra_headers=extra_headers, proxy=proxy, http2=http2
+        )
 
     def is_connected(self) -> bool:
         """Health check.
@@ -81,6 +81,8 @@ class AsyncClient(_ClientCore):  # pylint: disable=too-many-public-methods
         timeout: HTTP request timeout in seconds.
         extra_headers: Extra headers to pass for HTTP request.
         proxy: Proxy URL to pass to the HTTP client.
+        http2: Use HTTP/2 when the endpoint supports it, so that concurrent requests share one connection.
+            Requires the ``http2`` extra (``pip install solana[http2]``).
     """
 
     def __init__(
@@ -90,11 +92,12 @@ class AsyncClient(_ClientCore):  # pylint: disable=too-many-public-methods
         timeout: float = 10,
         extra_headers: Optional[Dict[str, str]] = None,
         proxy: Optional[str] = None,
+        http2: bool = False,
     ) -> None:
         """Init API client."""
         super().__init__(commitment)
         self._provider = async_http.AsyncHTTPProvider(
-            endpoint, timeout=timeout, extra_headers=extra_headers, proxy=proxy
+            endpoint, timeout=timeout, extra_headers=extra_headers, proxy=proxy, http2=http2
         )
 
     async def __aenter__(self) -> "AsyncClient":
@@ -46,10 +46,11 @@ class AsyncHTTPProvider(AsyncBaseProvider, _HTTPProviderCore):
         extra_headers: Optional[Dict[str, str]] = None,
         timeout: float = DEFAULT_TIMEOUT,
         proxy: Optional[str] = None,
+        http2: bool = False,
     ):
         """Init AsyncHTTPProvider."""
         super().__init__(endpoint, extra_headers)
-        self.session = httpx.AsyncClient(timeout=timeout, proxy=proxy)
+        self.session = httpx.AsyncClient(timeout=timeout, proxy=proxy, http2=http2)
 
     def __str__(self) -> str:
         """String definition for HTTPProvider."""
@@ -77,13 +77,13 @@ class _HTTPProviderCore:  # pylint: disable=too-few-public-methods
 
     def _build_request_kwargs(self, body: Body) -> Dict[str, Any]:
         common_kwargs = self._build_common_request_kwargs()
-        data = body.to_json()
-        return {**common_kwargs, "content": data}
+        common_kwargs["content"] = body.to_json()
+        return common_kwargs
 
     def _build_batch_request_kwargs(self, reqs: Tuple[Body, ...]) -> Dict[str, Any]:
         common_kwargs = self._build_common_request_kwargs()
-        data = batch_req_json(reqs)
-        return {**common_kwargs, "content": data}
+        common_kwargs["content"] = batch_req_json(reqs)
+        return common_kwargs
 
     def _before_request(self, body: Body) -> Dict[str, Any]:
         return self._build_request_kwargs(body=body)
@@ -1,5 +1,6 @@
 """Token instruction layouts."""
 
+import struct
 from enum import IntEnum
 
 from construct import Bytes, Int8ul, Int32ul, Int64ul, Pass, Switch
@@ -75,6 +76,14 @@ INSTRUCTIONS_LAYOUT = cStruct(
     ),
 )
 
+# Fixed-size encodings of INSTRUCTIONS_LAYOUT for the instructions that carry arguments, for building and
+# reading data without a construct build or parse.
+INITIALIZE_MINT_STRUCT = struct.Struct("<BB32sB32s")
+INITIALIZE_MULTISIG_STRUCT = struct.Struct("<BB")
+AMOUNT_STRUCT = struct.Struct("<BQ")
+SET_AUTHORITY_STRUCT = struct.Struct("<BBB32s")
+AMOUNT2_STRUCT = struct.Struct("<BQB")
+
 MINT_LAYOUT = cStruct(
     "mint_authority_option" / Int32ul,
     "mint_authority" / PUBLIC_KEY_LAYOUT,
@@ -85,6 +94,9 @@ MINT_LAYOUT = cStruct(
     "freeze_authority" / PUBLIC_KEY_LAYOUT,
 )
 
+# Reads the same fields as MINT_LAYOUT in one call; the layout is fixed-size, so decoding needs no construct parse.
+MINT_STRUCT = struct.Struct("<I32sQBBI32s")
+
 ACCOUNT_LAYOUT = cStruct(
     "mint" / PUBLIC_KEY_LAYOUT,
     "owner" / PUBLIC_KEY_LAYOUT,
@@ -115,3 +127,6 @@ MULTISIG_LAYOUT = cStruct(
     "signer10" / PUBLIC_KEY_LAYOUT,
     "signer11" / PUBLIC_KEY_LAYOUT,
 )
+
+# Reads the same fields as ACCOUNT_LAYOUT in one call.
+ACCOUNT_STRUCT = struct.Struct("<32s32sQI32sBIQQI32s")
@@ -3,35 +3,177 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Union, cast
-
-from solders.hash import Hash as Blockhash
-from solders.keypair import Keypair
-from solders.pubkey import Pubkey
-from solders.rpc.responses import (
-    GetTokenAccountBalanceResp,
-    GetTokenAccountsByDelegateJsonParsedResp,
-    GetTokenAccountsByDelegateResp,
-    GetTokenAccountsByOwnerJsonParsedResp,
-    GetTokenAccountsByOwnerResp,
-    SendTransactionResp,
-)
+import asyncio
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, List, Optional, Sequence, Tuple, TypeVar, Union, cast
 
-import spl.token.instructions as spl_token
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Commitment
 from solana.rpc.types import TxOpts
-from spl.token._layouts import ACCOUNT_LAYOUT, MINT_LAYOUT, MULTISIG_LAYOUT
-from spl.token.core import AccountInfo, MintInfo, _TokenCore
+from spl.token.constants import ACCOUNT_LEN, MINT_LEN, MULTISIG_LEN
+from spl.token.core import (
+    _MAX_MULTIPLE_ACCOUNTS,
+    _cache_rent_exempt,
+    _get_cached_rent_exempt,
+    _parse_batch,
+    _TokenCore,
+)
+
+if TYPE_CHECKING:
+    from solders.hash import Hash as Blockhash
+    from solders.keypair import Keypair
+    from solders.pubkey import Pubkey
+    from solders.rpc.responses import (
+        GetAccountInfoResp,
+        GetTokenAccountBalanceResp,
+        GetTokenAccountsByDelegateJsonParsedResp,
+        GetTokenAccountsByDelegateResp,
+        GetTokenAccountsByOwnerJsonParsedResp,
+        GetTokenAccountsByOwnerResp,
+        RPCResult,
+        SendTransactionResp,
+    )
+
+    import spl.token.instructions as spl_token
+    from solana.rpc.commitment import Commitment
+    from spl.token.core import AccountInfo, MintInfo
+
+T = TypeVar("T")
+
+
+def _check_max_inflight(max_inflight: int) -> None:
+    if max_inflight < 1:
+        raise ValueError(f"max_inflight must be at least 1, got {max_inflight}")
 
 
 class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
-    """An ERC20-like Token."""
+    """An ERC20-like Token.
+
+    Methods that send a transaction can skip the preflight simulation. This saves a simulation on the
+    validator per transaction, but a transaction that would have failed preflight is still submitted
+    and charged fees.
+    """
+
+    __slots__ = (
+        "_commitment",
+        "_conn",
+        "_default_opts",
+        "_inflight",
+        "_max_inflight",
+        "_pending_account_infos",
+    )
+
+    def __init__(
+        self,
+        conn: AsyncClient,
+        pubkey: Pubkey,
+        program_id: Pubkey,
+        payer: Keypair,
+        max_inflight: int = 32,
+        skip_preflight_default: bool = False,
+        blockhash_cache_ttl: float = 0.0,
+    ) -> None:
+        """Initialize a client to a SPL-Token program.
 
-    def __init__(self, conn: AsyncClient, pubkey: Pubkey, program_id: Pubkey, payer: Keypair) -> None:
-        """Initialize a client to a SPL-Token program."""
-        super().__init__(pubkey, program_id, payer)
+        Args:
+            conn: RPC connection to a solana cluster. Its HTTP session is shared by all requests; create it
+                with `http2=True` to multiplex concurrent requests over a single connection.
+            pubkey: Public key of the token mint.
+            program_id: SPL Token program account.
+            payer: Fee payer for transactions.
+            max_inflight: (optional) Maximum number of RPC requests this client runs concurrently. Must be at least 1.
+                The static and class methods, such as `create_mint()`, `create_mint_and_account()`,
+                `create_wrapped_native_account()` and the `get_min_balance_rent_for_exempt_for_*()` methods,
+                have no client to share the limit with, so their requests are not counted.
+            skip_preflight_default: (optional) Skip the preflight simulation for the transactions of the
+                `create_*` methods and of methods called without explicit `opts`.
+            blockhash_cache_ttl: (optional) Seconds for which a fetched blockhash is reused by methods called
+                without `recent_blockhash`. Disabled by default: two identical transactions built from the
+                same blockhash have the same signature, so the second one is rejected as a duplicate.
+
+        Raises:
+            ValueError: If `max_inflight` is less than 1.
+        """
+        _check_max_inflight(max_inflight)
+        super().__init__(pubkey, program_id, payer, blockhash_cache_ttl)
         self._conn = conn
+        self._commitment = conn.commitment
+        self._default_opts = TxOpts(skip_preflight=skip_preflight_default, preflight_commitment=self._commitment)
+        self._max_inflight = max_inflight
+        self._inflight: Optional[asyncio.Semaphore] = None
+        self._pending_account_infos: Dict[Tuple[Pubkey, Optional[Commitment]], asyncio.Future] = {}
+
+    def set_max_inflight(self, max_inflight: int) -> None:
+        """Set the maximum number of RPC requests this client runs concurrently.
+
+        The new limit applies to requests started from now on. Requests that are already running or
+        waiting for a slot finish under the previous limit.
+
+        Args:
+            max_inflight: Maximum number of concurrent RPC requests. Must be at least 1.
+
+        Raises:
+            ValueError: If `max_inflight` is less than 1.
+        """
+        _check_max_inflight(max_inflight)
+        self._max_inflight = max_inflight
+        # New requests get a new semaphore; the ones holding or waiting on the current one release it as usual.
+        self._inflight = None
+
+    async def _gated(self, coro: Coroutine[Any, Any, T]) -> T:
+        inflight = self._inflight
+        if inflight is None:
+            # Created on first use rather than in __init__: on Python 3.9 a semaphore binds to the event loop
+            # that is current when it is created, which need not be the one the client runs in.
+            inflight = self._inflight = asyncio.Semaphore(self._max_inflight)
+        try:
+            async with inflight:
+                return await coro
+        finally:
+            # Avoids a "never awaited" warning if we are cancelled while waiting for a slot.
+            coro.close()
+
+    async def _get_account_info_coalesced(
+        self, pubkey: Pubkey, commitment: Optional[Commitment] = None
+    ) -> GetAccountInfoResp:
+        # Concurrent lookups of the same account share one in-flight request.
+        key = (pubkey, commitment)
+        pending = self._pending_account_infos.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._gated(self._conn.get_account_info(pubkey, commitment)))
+            self._pending_account_infos[key] = pending
+            pending.add_done_callback(lambda fut: self._account_info_done(key, fut))
+        # Shielded so that one caller being cancelled does not cancel the request for the others.
+        return await asyncio.shield(pending)
+
+    def _account_info_done(self, key: Tuple[Pubkey, Optional[Commitment]], fut: asyncio.Future) -> None:
+        self._pending_account_infos.pop(key, None)
+        if not fut.cancelled():
+            # Marks the error as retrieved, so asyncio does not log it if every caller was cancelled.
+            fut.exception()
+
+    async def _get_recent_blockhash(self, recent_blockhash: Optional[Blockhash]) -> Blockhash:
+        if recent_blockhash is not None:
+            return recent_blockhash
+        cached = self._get_cached_blockhash()
+        return await self.refresh_blockhash() if cached is None else cached
+
+    async def refresh_blockhash(self) -> Blockhash:
+        """Fetch the latest blockhash and, if blockhash caching is enabled, keep it for reuse.
+
+        Returns:
+            The latest blockhash.
+        """
+        blockhash = (await self._gated(self._conn.get_latest_blockhash())).value.blockhash
+        self._cache_blockhash(blockhash)
+        return blockhash
+
+    @staticmethod
+    async def _get_min_balance_rent_for_exempt(conn: AsyncClient, size: int) -> int:
+        endpoint = conn._provider.endpoint_uri  # pylint: disable=protected-access
+        lamports = _get_cached_rent_exempt(endpoint, size)
+        if lamports is None:
+            lamports = (await conn.get_minimum_balance_for_rent_exemption(size)).value
+            _cache_rent_exempt(endpoint, size, lamports)
+        return lamports
 
     @staticmethod
     async def get_min_balance_rent_for_exempt_for_account(conn: AsyncClient) -> int:
@@ -42,9 +184,10 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
 
         Returns:
             Number of lamports required.
+
+        The result is cached per RPC endpoint for up to a minute, or until `clear_rent_exempt_cache()` is called.
         """
-        resp = await conn.get_minimum_balance_for_rent_exemption(ACCOUNT_LAYOUT.sizeof())
-        return resp.value
+        return await AsyncToken._get_min_balance_rent_for_exempt(conn, ACCOUNT_LEN)
 
     @staticmethod
     async def get_min_balance_rent_for_exempt_for_mint(conn: AsyncClient) -> int:
@@ -55,9 +198,10 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
 
         Returns:
             Number of lamports required.
+
+        The result is cached per RPC endpoint for up to a minute, or until `clear_rent_exempt_cache()` is called.
         """
-        resp = await conn.get_minimum_balance_for_rent_exemption(MINT_LAYOUT.sizeof())
-        return resp.value
+        return await AsyncToken._get_min_balance_rent_for_exempt(conn, MINT_LEN)
 
     @staticmethod
     async def get_min_balance_rent_for_exempt_for_multisig(conn: AsyncClient) -> int:
@@ -68,9 +212,10 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
 
         Returns:
              Number of lamports required.
+
+        The result is cached per RPC endpoint for up to a minute, or until `clear_rent_exempt_cache()` is called.
         """
-        resp = await conn.get_minimum_balance_for_rent_exemption(MULTISIG_LAYOUT.sizeof())
-        return resp.value
+        return await AsyncToken._get_min_balance_rent_for_exempt(conn, MULTISIG_LEN)
 
     async def get_accounts_by_owner(
         self,
@@ -89,9 +234,9 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             owner,
             commitment,
             encoding,
-            self._conn.commitment,  # pylint: disable=protected-access
+            self._commitment,
         )
-        return await self._conn.get_token_accounts_by_owner(*args)
+        return await self._gated(self._conn.get_token_accounts_by_owner(*args))
 
     async def get_accounts_by_owner_json_parsed(
         self,
@@ -114,9 +259,9 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             owner,
             commitment,
             "jsonParsed",
-            self._conn.commitment,  # pylint: disable=protected-access
+            self._commitment,
         )
-        return await self._conn.get_token_accounts_by_owner_json_parsed(*args)
+        return await self._gated(self._conn.get_token_accounts_by_owner_json_parsed(*args))
 
     async def get_accounts_by_delegate(
         self,
@@ -135,9 +280,9 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             owner,
             commitment,
             encoding,
-            self._conn.commitment,  # pylint: disable=protected-access
+            self._commitment,
         )
-        return await self._conn.get_token_accounts_by_delegate(*args)
+        return await self._gated(self._conn.get_token_accounts_by_delegate(*args))
 
     async def get_accounts_by_delegate_json_parsed(
         self,
@@ -161,9 +306,31 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             owner,
             commitment,
             encoding,
-            self._conn.commitment,  # pylint: disable=protected-access
+            self._commitment,
         )
-        return await self._conn.get_token_accounts_by_delegate_json_parsed(*args)
+        return await self._gated(self._conn.get_token_accounts_by_delegate_json_parsed(*args))
+
+    async def get_accounts_multi(
+        self, queries: Sequence[Tuple[str, Pubkey, Optional[Commitment], str]]
+    ) -> List[RPCResult]:
+        """Run several accounts-by-owner and accounts-by-delegate queries in one JSON-RPC batch request.
+
+        Each query is a ``(kind, pubkey, commitment, encoding)`` tuple. ``kind`` is ``"owner"`` or
+        ``"delegate"``, ``commitment`` may be ``None`` to use the client default, and ``encoding`` is
+        any encoding accepted by `get_accounts_by_owner()`, or ``"jsonParsed"``.
+
+        Args:
+            queries: The queries to run.
+
+        Returns:
+            One response per query, in the same order as `queries`. A query that failed yields an
+            RPC error object in its place.
+        """
+        if not queries:
+            return []
+        reqs, parsers = self._get_accounts_multi_args(self._conn, queries)
+        raw = await self._gated(self._conn._provider.make_batch_request_unparsed(reqs))  # pylint: disable=protected-access
+        return _parse_batch(raw, parsers)
 
     async def get_balance(self, pubkey: Pubkey, commitment: Optional[Commitment] = None) -> GetTokenAccountBalanceResp:
         """Get the balance of the provided token account.
@@ -172,7 +339,42 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             pubkey: Public Key of the token account.
             commitment: (optional) Bank state to query.
         """
-        return await self._conn.get_token_account_balance(pubkey, commitment)
+        return await self._gated(self._conn.get_token_account_balance(pubkey, commitment))
+
+    async def get_balances(
+        self, pubkeys: List[Pubkey], commitment: Optional[Commitment] = None
+    ) -> List[GetTokenAccountBalanceResp]:
+        """Get the balances of the provided token accounts.
+
+        The requests are issued concurrently rather than one after another.
+
+        Args:
+            pubkeys: Public Keys of the token accounts.
+            commitment: (optional) Bank state to query.
+
+        Returns:
+            The balance responses, in the same order as `pubkeys`.
+        """
+        return list(await asyncio.gather(*(self.get_balance(pubkey, commitment) for pubkey in pubkeys)))
+
+    async def get_balances_multi(
+        self, pubkeys: List[Pubkey], commitment: Optional[Commitment] = None
+    ) -> List[RPCResult]:
+        """Get the balances of the provided token accounts in one JSON-RPC batch request.
+
+        Args:
+            pubkeys: Public Keys of the token accounts.
+            commitment: (optional) Bank state to query.
+
+        Returns:
+            One response per account, in the same order as `pubkeys`. A lookup that failed yields an
+            RPC error object in its place.
+        """
+        if not pubkeys:
+            return []
+        reqs, parsers = self._get_balances_multi_args(self._conn, pubkeys, commitment)
+        raw = await self._gated(self._conn._provider.make_batch_request_unparsed(reqs))  # pylint: disable=protected-access
+        return _parse_batch(raw, parsers)
 
     @classmethod
     async def create_mint(
@@ -185,6 +387,8 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         freeze_authority: Optional[Pubkey] = None,
         skip_confirmation: bool = False,
         recent_blockhash: Optional[Blockhash] = None,
+        rent_exempt_balance: Optional[int] = None,
+        skip_preflight: bool = False,
     ) -> AsyncToken:
         """Create and initialize a token.
 
@@ -197,6 +401,8 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             freeze_authority: (optional) Account or multisig that can freeze token accounts.
             skip_confirmation: (optional) Option to skip transaction confirmation.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            rent_exempt_balance: (optional) a prefetched rent-exemption minimum in lamports.
+            skip_preflight: (optional) Skip the preflight simulation.
 
         Returns:
             Token object for the newly minted token.
@@ -205,7 +411,11 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         or until the transaction is confirmed.
         """
         # Allocate memory for the account
-        balance_needed = await AsyncToken.get_min_balance_rent_for_exempt_for_mint(conn)
+        balance_needed = (
+            await AsyncToken.get_min_balance_rent_for_exempt_for_mint(conn)
+            if rent_exempt_balance is None
+            else rent_exempt_balance
+        )
         # Construct transaction
         recent_blockhash_to_use = (
             (await conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
@@ -222,16 +432,89 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             cls,
             conn.commitment,
             recent_blockhash_to_use,
+            skip_preflight,
         )
         # Send the two instructions
         await conn.send_transaction(txn, opts=opts)
         return cast(AsyncToken, token)
 
+    @classmethod
+    async def create_mint_and_account(
+        cls,
+        conn: AsyncClient,
+        payer: Keypair,
+        mint_authority: Pubkey,
+        decimals: int,
+        program_id: Pubkey,
+        owner: Pubkey,
+        freeze_authority: Optional[Pubkey] = None,
+        skip_confirmation: bool = False,
+        recent_blockhash: Optional[Blockhash] = None,
+        mint_rent_exempt_balance: Optional[int] = None,
+        account_rent_exempt_balance: Optional[int] = None,
+        skip_preflight: bool = False,
+    ) -> Tuple[AsyncToken, Pubkey]:
+        """Create and initialize a token together with a first token account, in one transaction.
+
+        This is equivalent to `create_mint()` followed by `create_account()`, but submits a
+        single transaction instead of two.
+
+        Args:
+            conn: RPC connection to a solana cluster.
+            payer: Fee payer for transaction.
+            mint_authority: Account or multisig that will control minting.
+            decimals: Location of the decimal place.
+            program_id: SPL Token program account.
+            owner: User account that will own the new token account.
+            freeze_authority: (optional) Account or multisig that can freeze token accounts.
+            skip_confirmation: (optional) Option to skip transaction confirmation.
+            recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            mint_rent_exempt_balance: (optional) a prefetched rent-exemption minimum for the mint, in lamports.
+            account_rent_exempt_balance: (optional) a prefetched rent-exemption minimum for the account, in lamports.
+            skip_preflight: (optional) Skip the preflight simulation.
+
+        Returns:
+            Token object for the newly minted token and the public key of the new token account.
+
+        If skip confirmation is set to `False`, this method will block for at most 30 seconds
+        or until the transaction is confirmed.
+        """
+
+        async def rent_exempt_balance(supplied: Optional[int], size: int) -> int:
+            return await AsyncToken._get_min_balance_rent_for_exempt(conn, size) if supplied is None else supplied
+
+        mint_balance_needed, account_balance_needed = await asyncio.gather(
+            rent_exempt_balance(mint_rent_exempt_balance, MINT_LEN),
+            rent_exempt_balance(account_rent_exempt_balance, ACCOUNT_LEN),
+        )
+        recent_blockhash_to_use = (
+            (await conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
+        )
+        token, new_account_pk, txn, opts = _TokenCore._create_mint_and_account_args(
+            conn,
+            payer,
+            mint_authority,
+            decimals,
+            program_id,
+            owner,
+            freeze_authority,
+            skip_confirmation,
+            mint_balance_needed,
+            account_balance_needed,
+            cls,
+            conn.commitment,
+            recent_blockhash_to_use,
+            skip_preflight,
+        )
+        await conn.send_transaction(txn, opts=opts)
+        return cast(AsyncToken, token), new_account_pk
+
     async def create_account(
         self,
         owner: Pubkey,
         skip_confirmation: bool = False,
         recent_blockhash: Optional[Blockhash] = None,
+        rent_exempt_balance: Optional[int] = None,
     ) -> Pubkey:
         """Create and initialize a new account.
 
@@ -241,6 +524,7 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             owner: User account that will own the new account.
             skip_confirmation: (optional) Option to skip transaction confirmation.
             recent_blockhash (optional): A prefetched blockhash for the transaction.
+            rent_exempt_balance: (optional) a prefetched rent-exemption minimum in lamports.
 
         Returns:
             Public key of the new empty account.
@@ -248,17 +532,71 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         If skip confirmation is set to `False`, this method will block for at most 30 seconds
         or until the transaction is confirmed.
         """
-        balance_needed = await AsyncToken.get_min_balance_rent_for_exempt_for_account(self._conn)
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
+        balance_needed = (
+            await self._gated(AsyncToken.get_min_balance_rent_for_exempt_for_account(self._conn))
+            if rent_exempt_balance is None
+            else rent_exempt_balance
         )
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         new_account_pk, txn, opts = self._create_account_args(
-            owner, skip_confirmation, balance_needed, self._conn.commitment, recent_blockhash_to_use
+            owner,
+            skip_confirmation,
+            balance_needed,
+            self._commitment,
+            recent_blockhash_to_use,
+            self._default_opts.skip_preflight,
         )
         # Send the two instructions
-        await self._conn.send_transaction(txn, opts=opts)
+        await self._gated(self._conn.send_transaction(txn, opts=opts))
         return new_account_pk
 
+    async def create_accounts_bulk(
+        self,
+        owners: List[Pubkey],
+        skip_confirmation: bool = False,
+        recent_blockhash: Optional[Blockhash] = None,
+        rent_exempt_balance: Optional[int] = None,
+    ) -> List[Pubkey]:
+        """Create and initialize a new account for each of the given owners.
+
+        The rent-exemption minimum and the blockhash are fetched once and shared by all the
+        transactions, which are then sent concurrently.
+
+        Args:
+            owners: User accounts that will own the new accounts.
+            skip_confirmation: (optional) Option to skip transaction confirmation.
+            recent_blockhash: (optional) a prefetched Blockhash for the transactions.
+            rent_exempt_balance: (optional) a prefetched rent-exemption minimum in lamports.
+
+        Returns:
+            Public keys of the new empty accounts, in the same order as `owners`.
+        """
+        if not owners:
+            return []
+        if rent_exempt_balance is None:
+            balance_needed, recent_blockhash_to_use = await asyncio.gather(
+                self._gated(AsyncToken.get_min_balance_rent_for_exempt_for_account(self._conn)),
+                self._get_recent_blockhash(recent_blockhash),
+            )
+        else:
+            balance_needed, recent_blockhash_to_use = (
+                rent_exempt_balance,
+                await self._get_recent_blockhash(recent_blockhash),
+            )
+        created = [
+            self._create_account_args(
+                owner,
+                skip_confirmation,
+                balance_needed,
+                self._commitment,
+                recent_blockhash_to_use,
+                self._default_opts.skip_preflight,
+            )
+            for owner in owners
+        ]
+        await asyncio.gather(*(self._gated(self._conn.send_transaction(txn, opts=opts)) for _, txn, opts in created))
+        return [new_account_pk for new_account_pk, _, _ in created]
+
     async def create_associated_token_account(
         self,
         owner: Pubkey,
@@ -279,13 +617,11 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         or until the transaction is confirmed.
         """
         # Construct transaction
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         public_key, txn, payer, opts = self._create_associated_token_account_args(
-            owner, skip_confirmation, self._conn.commitment, recent_blockhash_to_use
+            owner, skip_confirmation, self._commitment, recent_blockhash_to_use, self._default_opts.skip_preflight
         )
-        await self._conn.send_transaction(txn, opts=opts)
+        await self._gated(self._conn.send_transaction(txn, opts=opts))
         return public_key
 
     @staticmethod
@@ -297,6 +633,8 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         amount: int,
         skip_confirmation: bool = False,
         recent_blockhash: Optional[Blockhash] = None,
+        rent_exempt_balance: Optional[int] = None,
+        skip_preflight: bool = False,
     ) -> Pubkey:
         """Create and initialize a new account on the special native token mint.
 
@@ -308,6 +646,8 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             amount: The amount of lamports to wrap.
             skip_confirmation: (optional) Option to skip transaction confirmation.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            rent_exempt_balance: (optional) a prefetched rent-exemption minimum in lamports.
+            skip_preflight: (optional) Skip the preflight simulation.
 
         Returns:
             The new token account.
@@ -316,7 +656,11 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         or until the transaction is confirmed.
         """
         # Allocate memory for the account
-        balance_needed = await AsyncToken.get_min_balance_rent_for_exempt_for_account(conn)
+        balance_needed = (
+            await AsyncToken.get_min_balance_rent_for_exempt_for_account(conn)
+            if rent_exempt_balance is None
+            else rent_exempt_balance
+        )
         recent_blockhash_to_use = (
             (await conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
         )
@@ -335,6 +679,7 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             balance_needed,
             conn.commitment,
             recent_blockhash_to_use,
+            skip_preflight,
         )
         await conn.send_transaction(txn, opts=opts)
         return new_account_public_key
@@ -345,6 +690,7 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: List[Pubkey],
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        rent_exempt_balance: Optional[int] = None,
     ) -> Pubkey:  # pylint: disable=invalid-name
         """Create and initialize a new multisig.
 
@@ -353,29 +699,97 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: Full set of signers.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            rent_exempt_balance: (optional) a prefetched rent-exemption minimum in lamports.
 
         Returns:
             Public key of the new multisig account.
         """
-        balance_needed = await AsyncToken.get_min_balance_rent_for_exempt_for_multisig(self._conn)
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
+        balance_needed = (
+            await self._gated(AsyncToken.get_min_balance_rent_for_exempt_for_multisig(self._conn))
+            if rent_exempt_balance is None
+            else rent_exempt_balance
         )
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, multisig = self._create_multisig_args(m, multi_signers, balance_needed, recent_blockhash_to_use)
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        await self._conn.send_transaction(txn, opts=opts_to_use)
+        opts_to_use = self._default_opts if opts is None else opts
+        await self._gated(self._conn.send_transaction(txn, opts=opts_to_use))
         return multisig.pubkey()
 
     async def get_mint_info(self) -> MintInfo:
         """Retrieve mint information."""
-        info = await self._conn.get_account_info(self.pubkey)
+        info = await self._get_account_info_coalesced(self.pubkey)
         return self._create_mint_info(info)
 
     async def get_account_info(self, account: Pubkey, commitment: Optional[Commitment] = None) -> AccountInfo:
         """Retrieve account information."""
-        info = await self._conn.get_account_info(account, commitment)
+        info = await self._get_account_info_coalesced(account, commitment)
         return self._create_account_info(info)
 
+    async def get_account_infos(
+        self, accounts: List[Pubkey], commitment: Optional[Commitment] = None
+    ) -> List[Optional[AccountInfo]]:
+        """Retrieve the information of several accounts.
+
+        The accounts are fetched with `getMultipleAccounts`, up to 100 per request, with the requests sent concurrently.
+
+        Args:
+            accounts: Public keys of the token accounts.
+            commitment: (optional) Bank state to query.
+
+        Returns:
+            The account information in the same order as `accounts`, with `None` for accounts that do not exist.
+        """
+        chunks = [
+            accounts[start : start + _MAX_MULTIPLE_ACCOUNTS]
+            for start in range(0, len(accounts), _MAX_MULTIPLE_ACCOUNTS)
+        ]
+        resps = await asyncio.gather(
+            *(self._gated(self._conn.get_multiple_accounts(chunk, commitment)) for chunk in chunks)
+        )
+        return [info for resp in resps for info in self._create_account_infos(resp)]
+
+    async def get_mint_and_accounts(
+        self, accounts: List[Pubkey], commitment: Optional[Commitment] = None
+    ) -> Tuple[MintInfo, List[Optional[AccountInfo]]]:
+        """Retrieve mint information together with the information of several accounts.
+
+        Everything is fetched with a single `getMultipleAccounts` request, so at most
+        99 accounts may be passed at once.
+
+        Args:
+            accounts: Public keys of the token accounts.
+            commitment: (optional) Bank state to query.
+
+        Returns:
+            The mint information and the account information in the same order as `accounts`, with `None`
+            for accounts that do not exist.
+
+        Raises:
+            ValueError: If more than 99 accounts are passed.
+        """
+        keys = self._mint_and_accounts_keys(accounts)
+        return self._decode_mint_and_accounts(await self._gated(self._conn.get_multiple_accounts(keys, commitment)))
+
+    async def get_mint_and_account_info(
+        self, account: Pubkey, commitment: Optional[Commitment] = None
+    ) -> Tuple[MintInfo, AccountInfo]:
+        """Retrieve mint information together with the information of one account, in a single request.
+
+        Args:
+            account: Public key of the token account.
+            commitment: (optional) Bank state to query.
+
+        Returns:
+            The mint information and the account information.
+
+        Raises:
+            ValueError: If the account does not exist.
+        """
+        mint_info, (account_info,) = await self.get_mint_and_accounts([account], commitment)
+        if account_info is None:
+            raise ValueError(f"Failed to find account {account}")
+        return mint_info, account_info
+
     async def transfer(
         self,
         source: Pubkey,
@@ -385,6 +799,7 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: Optional[List[Keypair]] = None,
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        skip_preflight: bool = False,
     ) -> SendTransactionResp:
         """Transfer tokens to another account.
 
@@ -396,15 +811,49 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: (optional) Signing accounts if `owner` is a multiSig.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            skip_preflight: (optional) Skip the preflight simulation.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        if skip_preflight:
+            opts_to_use = opts_to_use._replace(skip_preflight=True)
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._transfer_args(
             source, dest, owner, amount, multi_signers, opts_to_use, recent_blockhash_to_use
         )
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
+
+    async def transfer_many(
+        self,
+        transfers: List[Tuple[Pubkey, Pubkey, int]],
+        owner: Union[Keypair, Pubkey],
+        multi_signers: Optional[List[Keypair]] = None,
+        opts: Optional[TxOpts] = None,
+        recent_blockhash: Optional[Blockhash] = None,
+    ) -> List[SendTransactionResp]:
+        """Make several transfers from accounts of the same owner, packing them into as few transactions as possible.
+
+        Transfer instructions are added to a transaction until it reaches the transaction size limit,
+        so far fewer transactions (and signature fees) are needed than with one `transfer()` per
+        transfer. All the transactions share one blockhash. The transactions are sent one after another, in
+        order, each once the previous send has returned.
+
+        Args:
+            transfers: ``(source, dest, amount)`` tuples, in the order they should be made.
+            owner: Owner of the source accounts.
+            multi_signers: (optional) Signing accounts if `owner` is a multiSig.
+            opts: (optional) Transaction options.
+            recent_blockhash: (optional) a prefetched Blockhash for the transactions.
+
+        Returns:
+            One response per transaction sent.
+
+        Raises:
+            ValueError: If a single transfer, with its signers, does not fit in one transaction.
+        """
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
+        txns, opts = self._transfer_many_args(transfers, owner, multi_signers, opts_to_use, recent_blockhash_to_use)
+        return [await self._gated(self._conn.send_transaction(txn, opts=opts)) for txn in txns]
 
     async def approve(
         self,
@@ -427,14 +876,12 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, payer, signers, opts = self._approve_args(
             source, delegate, owner, amount, multi_signers, opts_to_use, recent_blockhash_to_use
         )
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
 
     async def revoke(
         self,
@@ -453,14 +900,12 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, payer, signers, opts = self._revoke_args(
             account, owner, multi_signers, opts_to_use, recent_blockhash_to_use
         )
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
 
     async def set_authority(
         self,
@@ -483,10 +928,8 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, payer, signers, opts = self._set_authority_args(
             account,
             current_authority,
@@ -496,7 +939,7 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             opts_to_use,
             recent_blockhash_to_use,
         )
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
 
     async def mint_to(
         self,
@@ -506,6 +949,7 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: Optional[List[Keypair]] = None,
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        skip_preflight: bool = False,
     ) -> SendTransactionResp:
         """Mint new tokens.
 
@@ -516,18 +960,19 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: (optional) Signing accounts if `owner` is a multisig.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            skip_preflight: (optional) Skip the preflight simulation.
 
         If skip confirmation is set to `False`, this method will block for at most 30 seconds
         or until the transaction is confirmed.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        if skip_preflight:
+            opts_to_use = opts_to_use._replace(skip_preflight=True)
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._mint_to_args(
             dest, mint_authority, amount, multi_signers, opts_to_use, recent_blockhash_to_use
         )
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
 
     async def burn(
         self,
@@ -537,6 +982,7 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: Optional[List[Keypair]] = None,
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        skip_preflight: bool = False,
     ) -> SendTransactionResp:
         """Burn tokens.
 
@@ -547,13 +993,14 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: (optional) Signing accounts if `owner` is a multiSig.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            skip_preflight: (optional) Skip the preflight simulation.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        if skip_preflight:
+            opts_to_use = opts_to_use._replace(skip_preflight=True)
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._burn_args(account, owner, amount, multi_signers, opts_to_use, recent_blockhash_to_use)
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
 
     async def close_account(
         self,
@@ -574,14 +1021,12 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._close_account_args(
             account, dest, authority, multi_signers, opts_to_use, recent_blockhash_to_use
         )
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
 
     async def freeze_account(
         self,
@@ -600,12 +1045,10 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._freeze_account_args(account, authority, multi_signers, opts_to_use, recent_blockhash_to_use)
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
 
     async def thaw_account(
         self,
@@ -624,12 +1067,10 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._thaw_account_args(account, authority, multi_signers, opts_to_use, recent_blockhash_to_use)
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
 
     async def transfer_checked(
         self,
@@ -641,6 +1082,7 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: Optional[List[Keypair]],
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        skip_preflight: bool = False,
     ) -> SendTransactionResp:
         """Transfer tokens to another account, asserting the token mint and decimals.
 
@@ -653,15 +1095,16 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: (optional) Signing accounts if `owner` is a multiSig.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            skip_preflight: (optional) Skip the preflight simulation.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        if skip_preflight:
+            opts_to_use = opts_to_use._replace(skip_preflight=True)
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._transfer_checked_args(
             source, dest, owner, amount, decimals, multi_signers, opts_to_use, recent_blockhash_to_use
         )
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
 
     async def approve_checked(
         self,
@@ -688,14 +1131,12 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash (optional): A prefetched blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._approve_checked_args(
             source, delegate, owner, amount, decimals, multi_signers, opts_to_use, recent_blockhash_to_use
         )
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
 
     async def mint_to_checked(
         self,
@@ -706,6 +1147,7 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: Optional[List[Keypair]] = None,
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        skip_preflight: bool = False,
     ) -> SendTransactionResp:
         """Mint new tokens, asserting the token mint and decimals.
 
@@ -717,15 +1159,16 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: (optional) Signing accounts if `owner` is a multiSig.
             opts: (optional) Transaction options.
             recent_blockhash (optional): A prefetched blockhash for the transaction.
+            skip_preflight: (optional) Skip the preflight simulation.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        if skip_preflight:
+            opts_to_use = opts_to_use._replace(skip_preflight=True)
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._mint_to_checked_args(
             dest, mint_authority, amount, decimals, multi_signers, opts_to_use, recent_blockhash_to_use
         )
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
 
     async def burn_checked(
         self,
@@ -736,6 +1179,7 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: Optional[List[Keypair]] = None,
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        skip_preflight: bool = False,
     ) -> SendTransactionResp:
         """Burn tokens, asserting the token mint and decimals.
 
@@ -747,11 +1191,12 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: (optional) Signing accounts if `owner` is a multisig.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            skip_preflight: (optional) Skip the preflight simulation.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            (await self._conn.get_latest_blockhash()).value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        if skip_preflight:
+            opts_to_use = opts_to_use._replace(skip_preflight=True)
+        recent_blockhash_to_use = await self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._burn_checked_args(
             account,
             owner,
@@ -761,4 +1206,4 @@ class AsyncToken(_TokenCore):  # pylint: disable=too-many-public-methods
             opts_to_use,
             recent_blockhash_to_use,
         )
-        return await self._conn.send_transaction(txn, opts=opts)
+        return await self._gated(self._conn.send_transaction(txn, opts=opts))
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Union, cast
+from typing import List, Optional, Sequence, Tuple, Union, cast
 
 from solders.hash import Hash as Blockhash
 from solders.keypair import Keypair
@@ -14,6 +14,7 @@ from solders.rpc.responses import (
     GetTokenAccountsByDelegateResp,
     GetTokenAccountsByOwnerJsonParsedResp,
     GetTokenAccountsByOwnerResp,
+    RPCResult,
     SendTransactionResp,
 )
 
@@ -21,17 +22,71 @@ import spl.token.instructions as spl_token
 from solana.rpc.api import Client
 from solana.rpc.commitment import Commitment
 from solana.rpc.types import TxOpts
-from spl.token._layouts import ACCOUNT_LAYOUT, MINT_LAYOUT, MULTISIG_LAYOUT
-from spl.token.core import AccountInfo, MintInfo, _TokenCore
+from spl.token.constants import ACCOUNT_LEN, MINT_LEN, MULTISIG_LEN
+from spl.token.core import (
+    _MAX_MULTIPLE_ACCOUNTS,
+    AccountInfo,
+    MintInfo,
+    _cache_rent_exempt,
+    _get_cached_rent_exempt,
+    _parse_batch,
+    _TokenCore,
+)
 
 
 class Token(_TokenCore):  # pylint: disable=too-many-public-methods
-    """An ERC20-like Token."""
+    """An ERC20-like Token.
+
+    Methods that send a transaction can skip the preflight simulation. This saves a simulation on the
+    validator per transaction, but a transaction that would have failed preflight is still submitted
+    and charged fees.
+    """
+
+    __slots__ = ("_commitment", "_conn", "_default_opts")
 
-    def __init__(self, conn: Client, pubkey: Pubkey, program_id: Pubkey, payer: Keypair) -> None:
-        """Initialize a client to a SPL-Token program."""
-        super().__init__(pubkey, program_id, payer)
+    def __init__(
+        self, conn: Client, pubkey: Pubkey, program_id: Pubkey, payer: Keypair, blockhash_cache_ttl: float = 0.0
+    ) -> None:
+        """Initialize a client to a SPL-Token program.
+
+        Args:
+            conn: RPC connection to a solana cluster.
+            pubkey: Public key of the token mint.
+            program_id: SPL Token program account.
+            payer: Fee payer for transactions.
+            blockhash_cache_ttl: (optional) Seconds for which a fetched blockhash is reused by methods called
+                without `recent_blockhash`. Disabled by default: two identical transactions built from the
+                same blockhash have the same signature, so the second one is rejected as a duplicate.
+        """
+        super().__init__(pubkey, program_id, payer, blockhash_cache_ttl)
         self._conn = conn
+        self._commitment = conn.commitment
+        self._default_opts = TxOpts(preflight_commitment=self._commitment)
+
+    def _get_recent_blockhash(self, recent_blockhash: Optional[Blockhash]) -> Blockhash:
+        if recent_blockhash is not None:
+            return recent_blockhash
+        cached = self._get_cached_blockhash()
+        return self.refresh_blockhash() if cached is None else cached
+
+    def refresh_blockhash(self) -> Blockhash:
+        """Fetch the latest blockhash and, if blockhash caching is enabled, keep it for reuse.
+
+        Returns:
+            The latest blockhash.
+        """
+        blockhash = self._conn.get_latest_blockhash().value.blockhash
+        self._cache_blockhash(blockhash)
+        return blockhash
+
+    @staticmethod
+    def _get_min_balance_rent_for_exempt(conn: Client, size: int) -> int:
+        endpoint = conn._provider.endpoint_uri  # pylint: disable=protected-access
+        lamports = _get_cached_rent_exempt(endpoint, size)
+        if lamports is None:
+            lamports = conn.get_minimum_balance_for_rent_exemption(size).value
+            _cache_rent_exempt(endpoint, size, lamports)
+        return lamports
 
     @staticmethod
     def get_min_balance_rent_for_exempt_for_account(conn: Client) -> int:
@@ -42,9 +97,10 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
 
         Returns:
             Number of lamports required.
+
+        The result is cached per RPC endpoint for up to a minute, or until `clear_rent_exempt_cache()` is called.
         """
-        resp = conn.get_minimum_balance_for_rent_exemption(ACCOUNT_LAYOUT.sizeof())
-        return resp.value
+        return Token._get_min_balance_rent_for_exempt(conn, ACCOUNT_LEN)
 
     @staticmethod
     def get_min_balance_rent_for_exempt_for_mint(conn: Client) -> int:
@@ -55,9 +111,10 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
 
         Returns:
             Number of lamports required.
+
+        The result is cached per RPC endpoint for up to a minute, or until `clear_rent_exempt_cache()` is called.
         """
-        resp = conn.get_minimum_balance_for_rent_exemption(MINT_LAYOUT.sizeof())
-        return resp.value
+        return Token._get_min_balance_rent_for_exempt(conn, MINT_LEN)
 
     @staticmethod
     def get_min_balance_rent_for_exempt_for_multisig(conn: Client) -> int:
@@ -67,9 +124,10 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             conn: RPC connection to a solana cluster.
 
         Return: Number of lamports required.
+
+        The result is cached per RPC endpoint for up to a minute, or until `clear_rent_exempt_cache()` is called.
         """
-        resp = conn.get_minimum_balance_for_rent_exemption(MULTISIG_LAYOUT.sizeof())
-        return resp.value
+        return Token._get_min_balance_rent_for_exempt(conn, MULTISIG_LEN)
 
     def get_accounts_by_owner(
         self,
@@ -88,7 +146,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             owner,
             commitment,
             encoding,
-            self._conn.commitment,  # pylint: disable=protected-access
+            self._commitment,
         )
         return self._conn.get_token_accounts_by_owner(*args)
 
@@ -113,7 +171,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             owner,
             commitment,
             "jsonParsed",
-            self._conn.commitment,  # pylint: disable=protected-access
+            self._commitment,
         )
         return self._conn.get_token_accounts_by_owner_json_parsed(*args)
 
@@ -134,7 +192,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             owner,
             commitment,
             encoding,
-            self._conn.commitment,  # pylint: disable=protected-access
+            self._commitment,
         )
         return self._conn.get_token_accounts_by_delegate(*args)
 
@@ -160,10 +218,30 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             owner,
             commitment,
             encoding,
-            self._conn.commitment,  # pylint: disable=protected-access
+            self._commitment,
         )
         return self._conn.get_token_accounts_by_delegate_json_parsed(*args)
 
+    def get_accounts_multi(self, queries: Sequence[Tuple[str, Pubkey, Optional[Commitment], str]]) -> List[RPCResult]:
+        """Run several accounts-by-owner and accounts-by-delegate queries in one JSON-RPC batch request.
+
+        Each query is a ``(kind, pubkey, commitment, encoding)`` tuple. ``kind`` is ``"owner"`` or
+        ``"delegate"``, ``commitment`` may be ``None`` to use the client default, and ``encoding`` is
+        any encoding accepted by `get_accounts_by_owner()`, or ``"jsonParsed"``.
+
+        Args:
+            queries: The queries to run.
+
+        Returns:
+            One response per query, in the same order as `queries`. A query that failed yields an
+            RPC error object in its place.
+        """
+        if not queries:
+            return []
+        reqs, parsers = self._get_accounts_multi_args(self._conn, queries)
+        raw = self._conn._provider.make_batch_request_unparsed(reqs)  # pylint: disable=protected-access
+        return _parse_batch(raw, parsers)
+
     def get_balance(self, pubkey: Pubkey, commitment: Optional[Commitment] = None) -> GetTokenAccountBalanceResp:
         """Get the balance of the provided token account.
 
@@ -173,6 +251,23 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         """
         return self._conn.get_token_account_balance(pubkey, commitment)
 
+    def get_balances_multi(self, pubkeys: List[Pubkey], commitment: Optional[Commitment] = None) -> List[RPCResult]:
+        """Get the balances of the provided token accounts in one JSON-RPC batch request.
+
+        Args:
+            pubkeys: Public Keys of the token accounts.
+            commitment: (optional) Bank state to query.
+
+        Returns:
+            One response per account, in the same order as `pubkeys`. A lookup that failed yields an
+            RPC error object in its place.
+        """
+        if not pubkeys:
+            return []
+        reqs, parsers = self._get_balances_multi_args(self._conn, pubkeys, commitment)
+        raw = self._conn._provider.make_batch_request_unparsed(reqs)  # pylint: disable=protected-access
+        return _parse_batch(raw, parsers)
+
     @classmethod
     def create_mint(
         cls,
@@ -184,6 +279,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         freeze_authority: Optional[Pubkey] = None,
         skip_confirmation: bool = False,
         recent_blockhash: Optional[Blockhash] = None,
+        rent_exempt_balance: Optional[int] = None,
     ) -> Token:
         """Create and initialize a token.
 
@@ -196,6 +292,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             freeze_authority: (optional) Account or multisig that can freeze token accounts.
             skip_confirmation: (optional) Option to skip transaction confirmation.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            rent_exempt_balance: (optional) a prefetched rent-exemption minimum in lamports.
 
         Returns:
             Token object for the newly minted token.
@@ -204,7 +301,9 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         or until the transaction is confirmed.
         """
         # Allocate memory for the account
-        balance_needed = Token.get_min_balance_rent_for_exempt_for_mint(conn)
+        balance_needed = (
+            Token.get_min_balance_rent_for_exempt_for_mint(conn) if rent_exempt_balance is None else rent_exempt_balance
+        )
         # Construct transaction
         recent_blockhash_to_use = (
             conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
@@ -226,11 +325,82 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         conn.send_transaction(txn, opts=opts)
         return cast(Token, token)
 
+    @classmethod
+    def create_mint_and_account(
+        cls,
+        conn: Client,
+        payer: Keypair,
+        mint_authority: Pubkey,
+        decimals: int,
+        program_id: Pubkey,
+        owner: Pubkey,
+        freeze_authority: Optional[Pubkey] = None,
+        skip_confirmation: bool = False,
+        recent_blockhash: Optional[Blockhash] = None,
+        mint_rent_exempt_balance: Optional[int] = None,
+        account_rent_exempt_balance: Optional[int] = None,
+    ) -> Tuple[Token, Pubkey]:
+        """Create and initialize a token together with a first token account, in one transaction.
+
+        This is equivalent to `create_mint()` followed by `create_account()`, but submits a
+        single transaction instead of two.
+
+        Args:
+            conn: RPC connection to a solana cluster.
+            payer: Fee payer for transaction.
+            mint_authority: Account or multisig that will control minting.
+            decimals: Location of the decimal place.
+            program_id: SPL Token program account.
+            owner: User account that will own the new token account.
+            freeze_authority: (optional) Account or multisig that can freeze token accounts.
+            skip_confirmation: (optional) Option to skip transaction confirmation.
+            recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            mint_rent_exempt_balance: (optional) a prefetched rent-exemption minimum for the mint, in lamports.
+            account_rent_exempt_balance: (optional) a prefetched rent-exemption minimum for the account, in lamports.
+
+        Returns:
+            Token object for the newly minted token and the public key of the new token account.
+
+        If skip confirmation is set to `False`, this method will block for at most 30 seconds
+        or until the transaction is confirmed.
+        """
+        mint_balance_needed = (
+            Token.get_min_balance_rent_for_exempt_for_mint(conn)
+            if mint_rent_exempt_balance is None
+            else mint_rent_exempt_balance
+        )
+        account_balance_needed = (
+            Token.get_min_balance_rent_for_exempt_for_account(conn)
+            if account_rent_exempt_balance is None
+            else account_rent_exempt_balance
+        )
+        recent_blockhash_to_use = (
+            conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
+        )
+        token, new_account_pk, txn, opts = _TokenCore._create_mint_and_account_args(
+            conn,
+            payer,
+            mint_authority,
+            decimals,
+            program_id,
+            owner,
+            freeze_authority,
+            skip_confirmation,
+            mint_balance_needed,
+            account_balance_needed,
+            cls,
+            conn.commitment,
+            recent_blockhash_to_use,
+        )
+        conn.send_transaction(txn, opts=opts)
+        return cast(Token, token), new_account_pk
+
     def create_account(
         self,
         owner: Pubkey,
         skip_confirmation: bool = False,
         recent_blockhash: Optional[Blockhash] = None,
+        rent_exempt_balance: Optional[int] = None,
     ) -> Pubkey:
         """Create and initialize a new account.
 
@@ -240,6 +410,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             owner: User account that will own the new account.
             skip_confirmation: (optional) Option to skip transaction confirmation.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            rent_exempt_balance: (optional) a prefetched rent-exemption minimum in lamports.
 
         Returns:
             Public key of the new empty account.
@@ -247,12 +418,14 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         If skip confirmation is set to `False`, this method will block for at most 30 seconds
         or until the transaction is confirmed.
         """
-        balance_needed = Token.get_min_balance_rent_for_exempt_for_account(self._conn)
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
+        balance_needed = (
+            Token.get_min_balance_rent_for_exempt_for_account(self._conn)
+            if rent_exempt_balance is None
+            else rent_exempt_balance
         )
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         new_account_pk, txn, opts = self._create_account_args(
-            owner, skip_confirmation, balance_needed, self._conn.commitment, recent_blockhash_to_use
+            owner, skip_confirmation, balance_needed, self._commitment, recent_blockhash_to_use
         )
         # Send the two instructions
         self._conn.send_transaction(txn, opts=opts)
@@ -278,11 +451,9 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         or until the transaction is confirmed.
         """
         # Construct transaction
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         public_key, txn, payer, opts = self._create_associated_token_account_args(
-            owner, skip_confirmation, self._conn.commitment, recent_blockhash_to_use
+            owner, skip_confirmation, self._commitment, recent_blockhash_to_use
         )
         self._conn.send_transaction(txn, opts=opts)
         return public_key
@@ -296,6 +467,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         amount: int,
         skip_confirmation: bool = False,
         recent_blockhash: Optional[Blockhash] = None,
+        rent_exempt_balance: Optional[int] = None,
     ) -> Pubkey:
         """Create and initialize a new account on the special native token mint.
 
@@ -307,6 +479,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             amount: The amount of lamports to wrap.
             skip_confirmation: (optional) Option to skip transaction confirmation.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            rent_exempt_balance: (optional) a prefetched rent-exemption minimum in lamports.
 
         Returns:
             The new token account.
@@ -315,7 +488,11 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         or until the transaction is confirmed.
         """
         # Allocate memory for the account
-        balance_needed = Token.get_min_balance_rent_for_exempt_for_account(conn)
+        balance_needed = (
+            Token.get_min_balance_rent_for_exempt_for_account(conn)
+            if rent_exempt_balance is None
+            else rent_exempt_balance
+        )
         recent_blockhash_to_use = (
             conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
         )
@@ -344,6 +521,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: List[Pubkey],
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        rent_exempt_balance: Optional[int] = None,
     ) -> Pubkey:  # pylint: disable=invalid-name
         """Create and initialize a new multisig.
 
@@ -352,16 +530,19 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: Full set of signers.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            rent_exempt_balance: (optional) a prefetched rent-exemption minimum in lamports.
 
         Returns:
             Public key of the new multisig account.
         """
-        balance_needed = Token.get_min_balance_rent_for_exempt_for_multisig(self._conn)
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
+        balance_needed = (
+            Token.get_min_balance_rent_for_exempt_for_multisig(self._conn)
+            if rent_exempt_balance is None
+            else rent_exempt_balance
         )
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, multisig = self._create_multisig_args(m, multi_signers, balance_needed, recent_blockhash_to_use)
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
+        opts_to_use = self._default_opts if opts is None else opts
         self._conn.send_transaction(txn, opts=opts_to_use)
         return multisig.pubkey()
 
@@ -375,6 +556,68 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         info = self._conn.get_account_info(account, commitment)
         return self._create_account_info(info)
 
+    def get_account_infos(
+        self, accounts: List[Pubkey], commitment: Optional[Commitment] = None
+    ) -> List[Optional[AccountInfo]]:
+        """Retrieve the information of several accounts.
+
+        The accounts are fetched with `getMultipleAccounts`, up to 100 per request.
+
+        Args:
+            accounts: Public keys of the token accounts.
+            commitment: (optional) Bank state to query.
+
+        Returns:
+            The account information in the same order as `accounts`, with `None` for accounts that do not exist.
+        """
+        infos: List[Optional[AccountInfo]] = []
+        for start in range(0, len(accounts), _MAX_MULTIPLE_ACCOUNTS):
+            resp = self._conn.get_multiple_accounts(accounts[start : start + _MAX_MULTIPLE_ACCOUNTS], commitment)
+            infos.extend(self._create_account_infos(resp))
+        return infos
+
+    def get_mint_and_accounts(
+        self, accounts: List[Pubkey], commitment: Optional[Commitment] = None
+    ) -> Tuple[MintInfo, List[Optional[AccountInfo]]]:
+        """Retrieve mint information together with the information of several accounts.
+
+        Everything is fetched with a single `getMultipleAccounts` request, so at most
+        99 accounts may be passed at once.
+
+        Args:
+            accounts: Public keys of the token accounts.
+            commitment: (optional) Bank state to query.
+
+        Returns:
+            The mint information and the account information in the same order as `accounts`, with `None`
+            for accounts that do not exist.
+
+        Raises:
+            ValueError: If more than 99 accounts are passed.
+        """
+        keys = self._mint_and_accounts_keys(accounts)
+        return self._decode_mint_and_accounts(self._conn.get_multiple_accounts(keys, commitment))
+
+    def get_mint_and_account_info(
+        self, account: Pubkey, commitment: Optional[Commitment] = None
+    ) -> Tuple[MintInfo, AccountInfo]:
+        """Retrieve mint information together with the information of one account, in a single request.
+
+        Args:
+            account: Public key of the token account.
+            commitment: (optional) Bank state to query.
+
+        Returns:
+            The mint information and the account information.
+
+        Raises:
+            ValueError: If the account does not exist.
+        """
+        mint_info, (account_info,) = self.get_mint_and_accounts([account], commitment)
+        if account_info is None:
+            raise ValueError(f"Failed to find account {account}")
+        return mint_info, account_info
+
     def transfer(
         self,
         source: Pubkey,
@@ -384,6 +627,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: Optional[List[Keypair]] = None,
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        skip_preflight: bool = False,
     ) -> SendTransactionResp:
         """Transfer tokens to another account.
 
@@ -395,16 +639,49 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: (optional) Signing accounts if `owner` is a multiSig.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            skip_preflight: (optional) Skip the preflight simulation.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        if skip_preflight:
+            opts_to_use = opts_to_use._replace(skip_preflight=True)
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._transfer_args(
             source, dest, owner, amount, multi_signers, opts_to_use, recent_blockhash_to_use
         )
         return self._conn.send_transaction(txn, opts=opts)
 
+    def transfer_many(
+        self,
+        transfers: List[Tuple[Pubkey, Pubkey, int]],
+        owner: Union[Keypair, Pubkey],
+        multi_signers: Optional[List[Keypair]] = None,
+        opts: Optional[TxOpts] = None,
+        recent_blockhash: Optional[Blockhash] = None,
+    ) -> List[SendTransactionResp]:
+        """Make several transfers from accounts of the same owner, packing them into as few transactions as possible.
+
+        Transfer instructions are added to a transaction until it reaches the transaction size limit,
+        so far fewer transactions (and signature fees) are needed than with one `transfer()` per
+        transfer. All the transactions share one blockhash. The transactions are sent one after another.
+
+        Args:
+            transfers: ``(source, dest, amount)`` tuples, in the order they should be made.
+            owner: Owner of the source accounts.
+            multi_signers: (optional) Signing accounts if `owner` is a multiSig.
+            opts: (optional) Transaction options.
+            recent_blockhash: (optional) a prefetched Blockhash for the transactions.
+
+        Returns:
+            One response per transaction sent.
+
+        Raises:
+            ValueError: If a single transfer, with its signers, does not fit in one transaction.
+        """
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
+        txns, opts = self._transfer_many_args(transfers, owner, multi_signers, opts_to_use, recent_blockhash_to_use)
+        return [self._conn.send_transaction(txn, opts=opts) for txn in txns]
+
     def approve(
         self,
         source: Pubkey,
@@ -426,10 +703,8 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, payer, signers, opts = self._approve_args(
             source, delegate, owner, amount, multi_signers, opts_to_use, recent_blockhash_to_use
         )
@@ -452,10 +727,8 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, payer, signers, opts = self._revoke_args(
             account, owner, multi_signers, opts_to_use, recent_blockhash_to_use
         )
@@ -482,10 +755,8 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, payer, signers, opts = self._set_authority_args(
             account,
             current_authority,
@@ -505,6 +776,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: Optional[List[Keypair]] = None,
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        skip_preflight: bool = False,
     ) -> SendTransactionResp:
         """Mint new tokens.
 
@@ -515,14 +787,15 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: (optional) Signing accounts if `owner` is a multiSig.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            skip_preflight: (optional) Skip the preflight simulation.
 
         If skip confirmation is set to `False`, this method will block for at most 30 seconds
         or until the transaction is confirmed.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        if skip_preflight:
+            opts_to_use = opts_to_use._replace(skip_preflight=True)
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._mint_to_args(
             dest, mint_authority, amount, multi_signers, opts_to_use, recent_blockhash_to_use
         )
@@ -536,6 +809,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: Optional[List[Keypair]] = None,
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        skip_preflight: bool = False,
     ) -> SendTransactionResp:
         """Burn tokens.
 
@@ -546,11 +820,12 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: (optional) Signing accounts if `owner` is a multiSig.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            skip_preflight: (optional) Skip the preflight simulation.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        if skip_preflight:
+            opts_to_use = opts_to_use._replace(skip_preflight=True)
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._burn_args(account, owner, amount, multi_signers, opts_to_use, recent_blockhash_to_use)
         return self._conn.send_transaction(txn, opts=opts)
 
@@ -573,10 +848,8 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._close_account_args(
             account, dest, authority, multi_signers, opts_to_use, recent_blockhash_to_use
         )
@@ -599,10 +872,8 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._freeze_account_args(account, authority, multi_signers, opts_to_use, recent_blockhash_to_use)
         return self._conn.send_transaction(txn, opts=opts)
 
@@ -623,10 +894,8 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._thaw_account_args(account, authority, multi_signers, opts_to_use, recent_blockhash_to_use)
         return self._conn.send_transaction(txn, opts=opts)
 
@@ -640,6 +909,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: Optional[List[Keypair]] = None,
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        skip_preflight: bool = False,
     ) -> SendTransactionResp:
         """Transfer tokens to another account, asserting the token mint and decimals.
 
@@ -652,11 +922,12 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: (optional) Signing accounts if `owner` is a multiSig.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            skip_preflight: (optional) Skip the preflight simulation.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        if skip_preflight:
+            opts_to_use = opts_to_use._replace(skip_preflight=True)
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._transfer_checked_args(
             source, dest, owner, amount, decimals, multi_signers, opts_to_use, recent_blockhash_to_use
         )
@@ -687,10 +958,8 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._approve_checked_args(
             source, delegate, owner, amount, decimals, multi_signers, opts_to_use, recent_blockhash_to_use
         )
@@ -705,6 +974,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: Optional[List[Keypair]] = None,
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        skip_preflight: bool = False,
     ) -> SendTransactionResp:
         """Mint new tokens, asserting the token mint and decimals.
 
@@ -716,11 +986,12 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: (optional) Signing accounts if `owner` is a multiSig.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            skip_preflight: (optional) Skip the preflight simulation.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        if skip_preflight:
+            opts_to_use = opts_to_use._replace(skip_preflight=True)
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._mint_to_checked_args(
             dest, mint_authority, amount, decimals, multi_signers, opts_to_use, recent_blockhash_to_use
         )
@@ -735,6 +1006,7 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
         multi_signers: Optional[List[Keypair]] = None,
         opts: Optional[TxOpts] = None,
         recent_blockhash: Optional[Blockhash] = None,
+        skip_preflight: bool = False,
     ) -> SendTransactionResp:
         """Burn tokens, asserting the token mint and decimals.
 
@@ -746,11 +1018,12 @@ class Token(_TokenCore):  # pylint: disable=too-many-public-methods
             multi_signers: (optional) Signing accounts if `owner` is a multiSig.
             opts: (optional) Transaction options.
             recent_blockhash: (optional) a prefetched Blockhash for the transaction.
+            skip_preflight: (optional) Skip the preflight simulation.
         """
-        opts_to_use = TxOpts(preflight_commitment=self._conn.commitment) if opts is None else opts
-        recent_blockhash_to_use = (
-            self._conn.get_latest_blockhash().value.blockhash if recent_blockhash is None else recent_blockhash
-        )
+        opts_to_use = self._default_opts if opts is None else opts
+        if skip_preflight:
+            opts_to_use = opts_to_use._replace(skip_preflight=True)
+        recent_blockhash_to_use = self._get_recent_blockhash(recent_blockhash)
         txn, opts = self._burn_checked_args(
             account, owner, amount, decimals, multi_signers, opts_to_use, recent_blockhash_to_use
         )
@@ -1,4 +1,7 @@
-"""SPL token constants."""
+"""SPL token constants.
+
+The public keys are built from their raw bytes, which is cheaper at import time than decoding base58.
+"""
 
 from solders.pubkey import Pubkey
 
@@ -11,16 +14,24 @@ ACCOUNT_LEN: int = 165
 MULTISIG_LEN: int = 355
 """Data length of a multisig token account."""
 
-ASSOCIATED_TOKEN_PROGRAM_ID = Pubkey.from_string("ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL")
+ASSOCIATED_TOKEN_PROGRAM_ID = Pubkey.from_bytes(
+    b"\x8c\x97\x25\x8f\x4e\x24\x89\xf1\xbb\x3d\x10\x29\x14\x8e\x0d\x83\x0b\x5a\x13\x99\xda\xff\x10\x84\x04\x8e\x7b\xd8\xdb\xe9\xf8\x59"
+)  # ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL
 """Program ID for the associated token account program."""
 
-TOKEN_PROGRAM_ID: Pubkey = Pubkey.from_string("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
+TOKEN_PROGRAM_ID: Pubkey = Pubkey.from_bytes(
+    b"\x06\xdd\xf6\xe1\xd7\x65\xa1\x93\xd9\xcb\xe1\x46\xce\xeb\x79\xac\x1c\xb4\x85\xed\x5f\x5b\x37\x91\x3a\x8c\xf5\x85\x7e\xff\x00\xa9"
+)  # TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA
 """Public key that identifies the SPL token program."""
 
-TOKEN_2022_PROGRAM_ID: Pubkey = Pubkey.from_string("TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb")
+TOKEN_2022_PROGRAM_ID: Pubkey = Pubkey.from_bytes(
+    b"\x06\xdd\xf6\xe1\xee\x75\x8f\xde\x18\x42\x5d\xbc\xe4\x6c\xcd\xda\xb6\x1a\xfc\x4d\x83\xb9\x0d\x27\xfe\xbd\xf9\x28\xd8\xa1\x8b\xfc"
+)  # TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb
 """Public key that identifies the SPL token 2022 program."""
 
-WRAPPED_SOL_MINT: Pubkey = Pubkey.from_string("So11111111111111111111111111111111111111112")
+WRAPPED_SOL_MINT: Pubkey = Pubkey.from_bytes(
+    b"\x06\x9b\x88\x57\xfe\xab\x81\x84\xfb\x68\x7f\x63\x46\x18\xc0\x35\xda\xc4\x39\xdc\x1a\xeb\x3b\x55\x98\xa0\xf0\x00\x00\x00\x00\x01"
+)  # So11111111111111111111111111111111111111112
 """Public key of the "Native Mint" for wrapping SOL to SPL token.
 
 The Token Program can be used to wrap native SOL. Doing so allows native SOL to be treated like any
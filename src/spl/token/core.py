@@ -3,12 +3,26 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple, Type, Union
+import re
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, Type, Union
 
 import solders.system_program as sp
 from solders.keypair import Keypair
+from solders.account import Account
 from solders.pubkey import Pubkey
-from solders.rpc.responses import GetAccountInfoResp
+from solders.rpc.requests import Body, GetTokenAccountBalance, GetTokenAccountsByDelegate, GetTokenAccountsByOwner
+from solders.rpc.responses import (
+    GetAccountInfoResp,
+    GetMultipleAccountsResp,
+    GetTokenAccountBalanceResp,
+    GetTokenAccountsByDelegateJsonParsedResp,
+    GetTokenAccountsByDelegateResp,
+    GetTokenAccountsByOwnerJsonParsedResp,
+    GetTokenAccountsByOwnerResp,
+    RPCResult,
+    batch_from_json,
+)
 
 import spl.token.instructions as spl_token
 from solana.rpc.api import Client
@@ -16,16 +30,92 @@ from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Commitment
 from solana.rpc.types import TokenAccountOpts, TxOpts
 from solders.hash import Hash as Blockhash
+from solders.instruction import Instruction
 from solders.message import Message
 from solders.transaction import Transaction
-from spl.token._layouts import ACCOUNT_LAYOUT, MINT_LAYOUT, MULTISIG_LAYOUT  # type: ignore
-from spl.token.constants import WRAPPED_SOL_MINT
+from spl.token._layouts import ACCOUNT_STRUCT, MINT_STRUCT  # type: ignore
+from spl.token.constants import ACCOUNT_LEN, MINT_LEN, MULTISIG_LEN, WRAPPED_SOL_MINT
 
 if TYPE_CHECKING:
     from spl.token.async_client import AsyncToken
     from spl.token.client import Token
 
 
+_RENT_EXEMPT_CACHE_TTL = 60.0
+"""Seconds for which a fetched rent-exemption minimum is reused."""
+
+_RENT_EXEMPT_CACHE_SIZE = 64
+"""Maximum number of (endpoint, size) entries kept in the rent-exemption cache."""
+
+_rent_exempt_cache: Dict[Tuple[str, int], Tuple[int, float]] = {}
+
+
+def clear_rent_exempt_cache() -> None:
+    """Forget all cached rent-exemption minimums, so that the next lookups query the RPC endpoint."""
+    _rent_exempt_cache.clear()
+
+
+def _get_cached_rent_exempt(endpoint: str, size: int) -> Optional[int]:
+    cached = _rent_exempt_cache.get((endpoint, size))
+    if cached is None or time.monotonic() - cached[1] > _RENT_EXEMPT_CACHE_TTL:
+        return None
+    return cached[0]
+
+
+def _cache_rent_exempt(endpoint: str, size: int, lamports: int) -> None:
+    # Entries are kept in insertion order, so re-inserting a refreshed one and evicting from the front drops the
+    # entry that was fetched longest ago.
+    key = (endpoint, size)
+    _rent_exempt_cache.pop(key, None)
+    _rent_exempt_cache[key] = (lamports, time.monotonic())
+    if len(_rent_exempt_cache) > _RENT_EXEMPT_CACHE_SIZE:
+        del _rent_exempt_cache[next(iter(_rent_exempt_cache))]
+
+
+_MAX_MULTIPLE_ACCOUNTS = 100
+"""Maximum number of accounts a single ``getMultipleAccounts`` request may ask for."""
+
+_PACKET_DATA_SIZE = 1232
+"""Maximum size of a serialized transaction, in bytes."""
+
+_ACCOUNTS_QUERIES: Dict[Tuple[str, bool], Tuple[Any, Type[RPCResult]]] = {
+    ("owner", False): (GetTokenAccountsByOwner, GetTokenAccountsByOwnerResp),
+    ("owner", True): (GetTokenAccountsByOwner, GetTokenAccountsByOwnerJsonParsedResp),
+    ("delegate", False): (GetTokenAccountsByDelegate, GetTokenAccountsByDelegateResp),
+    ("delegate", True): (GetTokenAccountsByDelegate, GetTokenAccountsByDelegateJsonParsedResp),
+}
+"""Request body and response parser for each (query kind, is jsonParsed) pair in ``get_accounts_multi``."""
+
+
+_RESPONSE_ID = re.compile(r'"id"\s*:\s*(\d+)')
+"""Matches the id of a JSON-RPC response and captures its value."""
+
+_ACCOUNT_STATES = ((False, False), (True, False), (True, True))
+"""(is_initialized, is_frozen) for each token account state: uninitialized, initialized and frozen."""
+
+
+def _parse_batch(raw: str, parsers: Sequence[Type[RPCResult]]) -> List[RPCResult]:
+    # The JSON-RPC spec lets a server answer a batch in any order, so match responses to requests by id. The ids
+    # are found by a regex scan rather than a full decode, and the parsers are lined up with the response order
+    # so that the document is parsed once. Without exactly one id per request, the order is taken as is.
+    ids = [int(id_) for id_ in _RESPONSE_ID.findall(raw)]
+    expected = list(range(len(parsers)))
+    if ids == expected or sorted(ids) != expected:
+        return batch_from_json(raw, list(parsers))
+    results = batch_from_json(raw, [parsers[id_] for id_ in ids])
+    ordered = list(results)
+    for id_, result in zip(ids, results):
+        ordered[id_] = result
+    return ordered
+
+
+def _build_tx(
+    ixs: Sequence[Instruction], signers: Sequence[Keypair], payer_pubkey: Pubkey, recent_blockhash: Blockhash
+) -> Transaction:
+    """Compile ``ixs`` into a message paid for by ``payer_pubkey`` and sign it with ``signers``."""
+    return Transaction(signers, Message.new_with_blockhash(ixs, payer_pubkey, recent_blockhash), recent_blockhash)
+
+
 class AccountInfo(NamedTuple):
     """Information about an account."""
 
@@ -76,18 +166,86 @@ class MintInfo(NamedTuple):
 
 
 class _TokenCore:  # pylint: disable=too-few-public-methods
-    pubkey: Pubkey
-    """The public key identifying this mint."""
+    __slots__ = (
+        "_blockhash_cache_ttl",
+        "_cached_blockhash",
+        "_payer",
+        "_payer_pubkey",
+        "_payer_signers",
+        "_pubkey",
+        "_pubkey_bytes",
+        "_token_account_opts",
+        "program_id",
+        "__weakref__",
+    )
 
     program_id: Pubkey
     """Program Identifier for the Token program."""
 
-    payer: Keypair
-    """Fee payer."""
+    _blockhash_cache_ttl: float
+    _cached_blockhash: Optional[Tuple[Blockhash, float]]
 
-    def __init__(self, pubkey: Pubkey, program_id: Pubkey, payer: Keypair) -> None:
+    def __init__(self, pubkey: Pubkey, program_id: Pubkey, payer: Keypair, blockhash_cache_ttl: float = 0.0) -> None:
         """Initialize a client to a SPL-Token program."""
         self.pubkey, self.program_id, self.payer = pubkey, program_id, payer
+        self._blockhash_cache_ttl = blockhash_cache_ttl
+        self._cached_blockhash = None
+
+    @property
+    def pubkey(self) -> Pubkey:
+        """The public key identifying this mint."""
+        return self._pubkey
+
+    @pubkey.setter
+    def pubkey(self, pubkey: Pubkey) -> None:
+        # Decoders compare raw account data against the mint, so keep its bytes alongside it. Cached
+        # account query options embed the mint, so they are reset with it.
+        self._pubkey = pubkey
+        self._pubkey_bytes = bytes(pubkey)
+        self._token_account_opts: Dict[str, TokenAccountOpts] = {}
+
+    @property
+    def payer(self) -> Keypair:
+        """Fee payer."""
+        return self._payer
+
+    @payer.setter
+    def payer(self, payer: Keypair) -> None:
+        # Builders use the payer's public key and signer list for every transaction, so derive them once here.
+        self._payer = payer
+        self._payer_pubkey = payer.pubkey()
+        self._payer_signers = (payer,)
+
+    def _get_cached_blockhash(self) -> Optional[Blockhash]:
+        cached = self._cached_blockhash
+        if cached is None or time.monotonic() - cached[1] >= self._blockhash_cache_ttl:
+            return None
+        return cached[0]
+
+    def _cache_blockhash(self, blockhash: Blockhash) -> None:
+        self._cached_blockhash = (blockhash, time.monotonic())
+
+    def _keypair_pubkey(self, keypair: Keypair) -> Pubkey:
+        # Keypair.pubkey() derives the key from the secret on every call; the payer's is already known.
+        return self._payer_pubkey if keypair is self._payer else keypair.pubkey()
+
+    def _resolve_authority(
+        self, authority: Union[Keypair, Pubkey], multi_signers: Optional[List[Keypair]]
+    ) -> Tuple[Pubkey, List[Keypair], List[Pubkey]]:
+        """Return the authority's public key, the keypairs signing for it and their multisig signer keys."""
+        if isinstance(authority, Keypair):
+            # A single keypair signs as the authority account itself; the extra signer accounts that
+            # instructions append are only for multisig authorities.
+            return self._keypair_pubkey(authority), [authority], []
+        signers = multi_signers if multi_signers else []
+        return authority, signers, [self._keypair_pubkey(signer) for signer in signers]
+
+    def _get_token_account_opts(self, encoding: str) -> TokenAccountOpts:
+        # TokenAccountOpts is immutable and only varies with the encoding, so build one per encoding.
+        opts = self._token_account_opts.get(encoding)
+        if opts is None:
+            opts = self._token_account_opts[encoding] = TokenAccountOpts(mint=self.pubkey, encoding=encoding)
+        return opts
 
     def _get_accounts_args(
         self,
@@ -99,10 +257,43 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         commitment_to_use = default_commitment if commitment is None else commitment
         return (
             owner,
-            TokenAccountOpts(mint=self.pubkey, encoding=encoding),
+            self._get_token_account_opts(encoding),
             commitment_to_use,
         )
 
+    def _get_accounts_multi_args(
+        self,
+        conn: Union[Client, AsyncClient],
+        queries: Sequence[Tuple[str, Pubkey, Optional[Commitment], str]],
+    ) -> Tuple[Tuple[Body, ...], List[Type[RPCResult]]]:
+        reqs: List[Body] = []
+        parsers: List[Type[RPCResult]] = []
+        for req_id, (kind, account, commitment, encoding) in enumerate(queries):
+            try:
+                req_cls, parser = _ACCOUNTS_QUERIES[(kind, encoding == "jsonParsed")]
+            except KeyError:
+                raise ValueError(f"Unknown query kind {kind!r}, expected 'owner' or 'delegate'") from None
+            opts = self._get_token_account_opts(encoding)
+            pubkey, filter_, config = conn._get_token_accounts_convert(  # pylint: disable=protected-access
+                account, opts, commitment
+            )
+            reqs.append(req_cls(pubkey, filter_, config, id=req_id))
+            parsers.append(parser)
+        return tuple(reqs), parsers
+
+    @staticmethod
+    def _get_balances_multi_args(
+        conn: Union[Client, AsyncClient], pubkeys: Sequence[Pubkey], commitment: Optional[Commitment]
+    ) -> Tuple[Tuple[Body, ...], List[Type[RPCResult]]]:
+        # Request bodies are immutable, so resolve the commitment once and give each body its own id.
+        commitment_to_use = conn._get_token_account_balance_body(  # pylint: disable=protected-access
+            pubkeys[0], commitment
+        ).commitment
+        reqs = tuple(
+            GetTokenAccountBalance(pubkey, commitment_to_use, id=req_id) for req_id, pubkey in enumerate(pubkeys)
+        )
+        return reqs, [GetTokenAccountBalanceResp] * len(reqs)
+
     @staticmethod
     def _create_mint_args(
         conn: Union[Client, AsyncClient],
@@ -116,36 +307,38 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         cls: Union[Type[Token], Type[AsyncToken]],
         commitment: Commitment,
         recent_blockhash: Blockhash,
+        skip_preflight: bool = False,
     ) -> Tuple[Union[Token, AsyncToken], Transaction, TxOpts]:
         mint_keypair = Keypair()
-        token = cls(conn, mint_keypair.pubkey(), program_id, payer)  # type: ignore
+        mint_pubkey = mint_keypair.pubkey()
+        token = cls(conn, mint_pubkey, program_id, payer)  # type: ignore
+        payer_pubkey = token._payer_pubkey  # pylint: disable=protected-access
         # Construct transaction
         ixs = [
             sp.create_account(
                 sp.CreateAccountParams(
-                    from_pubkey=payer.pubkey(),
-                    to_pubkey=mint_keypair.pubkey(),
+                    from_pubkey=payer_pubkey,
+                    to_pubkey=mint_pubkey,
                     lamports=balance_needed,
-                    space=MINT_LAYOUT.sizeof(),
+                    space=MINT_LEN,
                     owner=program_id,
                 )
             ),
             spl_token.initialize_mint(
                 spl_token.InitializeMintParams(
                     program_id=program_id,
-                    mint=mint_keypair.pubkey(),
+                    mint=mint_pubkey,
                     decimals=decimals,
                     mint_authority=mint_authority,
                     freeze_authority=freeze_authority,
                 )
             ),
         ]
-        msg = Message.new_with_blockhash(ixs, payer.pubkey(), recent_blockhash)
-        txn = Transaction([payer, mint_keypair], msg, recent_blockhash)
+        txn = _build_tx(ixs, [payer, mint_keypair], payer_pubkey, recent_blockhash)
         return (
             token,
             txn,
-            TxOpts(skip_confirmation=skip_confirmation, preflight_commitment=commitment),
+            TxOpts(skip_confirmation=skip_confirmation, skip_preflight=skip_preflight, preflight_commitment=commitment),
         )
 
     def _create_account_args(
@@ -155,50 +348,122 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         balance_needed: int,
         commitment: Commitment,
         recent_blockhash: Blockhash,
+        skip_preflight: bool = False,
     ) -> Tuple[Pubkey, Transaction, TxOpts]:
         new_keypair = Keypair()
+        new_pubkey = new_keypair.pubkey()
         # Allocate memory for the account
 
         # Construct transaction
         ixs = [
             sp.create_account(
                 sp.CreateAccountParams(
-                    from_pubkey=self.payer.pubkey(),
-                    to_pubkey=new_keypair.pubkey(),
+                    from_pubkey=self._payer_pubkey,
+                    to_pubkey=new_pubkey,
                     lamports=balance_needed,
-                    space=ACCOUNT_LAYOUT.sizeof(),
+                    space=ACCOUNT_LEN,
                     owner=self.program_id,
                 )
             ),
             spl_token.initialize_account(
                 spl_token.InitializeAccountParams(
-                    account=new_keypair.pubkey(),
+                    account=new_pubkey,
                     mint=self.pubkey,
                     owner=owner,
                     program_id=self.program_id,
                 )
             ),
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer, new_keypair], msg, recent_blockhash)
+        txn = _build_tx(ixs, [self.payer, new_keypair], self._payer_pubkey, recent_blockhash)
+        return (
+            new_pubkey,
+            txn,
+            TxOpts(skip_confirmation=skip_confirmation, skip_preflight=skip_preflight, preflight_commitment=commitment),
+        )
+
+    @staticmethod
+    def _create_mint_and_account_args(
+        conn: Union[Client, AsyncClient],
+        payer: Keypair,
+        mint_authority: Pubkey,
+        decimals: int,
+        program_id: Pubkey,
+        owner: Pubkey,
+        freeze_authority: Optional[Pubkey],
+        skip_confirmation: bool,
+        mint_balance_needed: int,
+        account_balance_needed: int,
+        cls: Union[Type[Token], Type[AsyncToken]],
+        commitment: Commitment,
+        recent_blockhash: Blockhash,
+        skip_preflight: bool = False,
+    ) -> Tuple[Union[Token, AsyncToken], Pubkey, Transaction, TxOpts]:
+        mint_keypair, new_keypair = Keypair(), Keypair()
+        mint_pubkey, new_pubkey = mint_keypair.pubkey(), new_keypair.pubkey()
+        token = cls(conn, mint_pubkey, program_id, payer)  # type: ignore
+        payer_pubkey = token._payer_pubkey  # pylint: disable=protected-access
+        # Construct transaction
+        ixs = [
+            sp.create_account(
+                sp.CreateAccountParams(
+                    from_pubkey=payer_pubkey,
+                    to_pubkey=mint_pubkey,
+                    lamports=mint_balance_needed,
+                    space=MINT_LEN,
+                    owner=program_id,
+                )
+            ),
+            spl_token.initialize_mint(
+                spl_token.InitializeMintParams(
+                    program_id=program_id,
+                    mint=mint_pubkey,
+                    decimals=decimals,
+                    mint_authority=mint_authority,
+                    freeze_authority=freeze_authority,
+                )
+            ),
+            sp.create_account(
+                sp.CreateAccountParams(
+                    from_pubkey=payer_pubkey,
+                    to_pubkey=new_pubkey,
+                    lamports=account_balance_needed,
+                    space=ACCOUNT_LEN,
+                    owner=program_id,
+                )
+            ),
+            spl_token.initialize_account(
+                spl_token.InitializeAccountParams(
+                    account=new_pubkey,
+                    mint=mint_pubkey,
+                    owner=owner,
+                    program_id=program_id,
+                )
+            ),
+        ]
+        txn = _build_tx(ixs, [payer, mint_keypair, new_keypair], payer_pubkey, recent_blockhash)
         return (
-            new_keypair.pubkey(),
+            token,
+            new_pubkey,
             txn,
-            TxOpts(skip_confirmation=skip_confirmation, preflight_commitment=commitment),
+            TxOpts(skip_confirmation=skip_confirmation, skip_preflight=skip_preflight, preflight_commitment=commitment),
         )
 
     def _create_associated_token_account_args(
-        self, owner: Pubkey, skip_confirmation: bool, commitment: Commitment, recent_blockhash: Blockhash
+        self,
+        owner: Pubkey,
+        skip_confirmation: bool,
+        commitment: Commitment,
+        recent_blockhash: Blockhash,
+        skip_preflight: bool = False,
     ) -> Tuple[Pubkey, Transaction, Keypair, TxOpts]:
         # Construct transaction
-        ix = spl_token.create_associated_token_account(payer=self.payer.pubkey(), owner=owner, mint=self.pubkey)
-        msg = Message.new_with_blockhash([ix], self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer], msg, recent_blockhash)
+        ix = spl_token.create_associated_token_account(payer=self._payer_pubkey, owner=owner, mint=self.pubkey)
+        txn = _build_tx((ix,), self._payer_signers, self._payer_pubkey, recent_blockhash)
         return (
             ix.accounts[1].pubkey,
             txn,
             self.payer,
-            TxOpts(skip_confirmation=skip_confirmation, preflight_commitment=commitment),
+            TxOpts(skip_confirmation=skip_confirmation, skip_preflight=skip_preflight, preflight_commitment=commitment),
         )
 
     @staticmethod
@@ -211,45 +476,46 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         balance_needed: int,
         commitment: Commitment,
         recent_blockhash: Blockhash,
+        skip_preflight: bool = False,
     ) -> Tuple[Pubkey, Transaction, Keypair, Keypair, TxOpts]:
         new_keypair = Keypair()
+        new_pubkey, payer_pubkey = new_keypair.pubkey(), payer.pubkey()
         # Allocate memory for the account
         # Construct transaction
         ixs = [
             sp.create_account(
                 sp.CreateAccountParams(
-                    from_pubkey=payer.pubkey(),
-                    to_pubkey=new_keypair.pubkey(),
+                    from_pubkey=payer_pubkey,
+                    to_pubkey=new_pubkey,
                     lamports=balance_needed,
-                    space=ACCOUNT_LAYOUT.sizeof(),
+                    space=ACCOUNT_LEN,
                     owner=program_id,
                 )
             ),
             sp.transfer(
                 sp.TransferParams(
-                    from_pubkey=payer.pubkey(),
-                    to_pubkey=new_keypair.pubkey(),
+                    from_pubkey=payer_pubkey,
+                    to_pubkey=new_pubkey,
                     lamports=amount,
                 )
             ),
             spl_token.initialize_account(
                 spl_token.InitializeAccountParams(
-                    account=new_keypair.pubkey(),
+                    account=new_pubkey,
                     mint=WRAPPED_SOL_MINT,
                     owner=owner,
                     program_id=program_id,
                 )
             ),
         ]
-        msg = Message.new_with_blockhash(ixs, payer.pubkey(), recent_blockhash)
-        txn = Transaction([payer, new_keypair], msg, recent_blockhash)
+        txn = _build_tx(ixs, [payer, new_keypair], payer_pubkey, recent_blockhash)
 
         return (
-            new_keypair.pubkey(),
+            new_pubkey,
             txn,
             payer,
             new_keypair,
-            TxOpts(skip_confirmation=skip_confirmation, preflight_commitment=commitment),
+            TxOpts(skip_confirmation=skip_confirmation, skip_preflight=skip_preflight, preflight_commitment=commitment),
         )
 
     def _transfer_args(
@@ -262,12 +528,7 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, TxOpts]:
-        if isinstance(owner, Keypair):
-            owner_pubkey = owner.pubkey()
-            signers = [owner]
-        else:
-            owner_pubkey = owner
-            signers = multi_signers if multi_signers else []
+        owner_pubkey, signers, signer_pubkeys = self._resolve_authority(owner, multi_signers)
         ixs = [
             spl_token.transfer(
                 spl_token.TransferParams(
@@ -276,14 +537,64 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
                     dest=dest,
                     owner=owner_pubkey,
                     amount=amount,
-                    signers=[signer.pubkey() for signer in signers],
+                    signers=signer_pubkeys,
                 )
             )
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer, *signers], msg, recent_blockhash)
+        txn = _build_tx(ixs, [self.payer, *signers], self._payer_pubkey, recent_blockhash)
         return txn, opts
 
+    def _transfer_many_args(
+        self,
+        transfers: Sequence[Tuple[Pubkey, Pubkey, int]],
+        owner: Union[Keypair, Pubkey],
+        multi_signers: Optional[List[Keypair]],
+        opts: TxOpts,
+        recent_blockhash: Blockhash,
+    ) -> Tuple[List[Transaction], TxOpts]:
+        owner_pubkey, signers, signer_pubkeys = self._resolve_authority(owner, multi_signers)
+        payer_pubkey = self._payer_pubkey
+        batches: List[List[Instruction]] = []
+        ixs: List[Instruction] = []
+        keys: Set[Pubkey] = set()
+        size = 0
+        for source, dest, amount in transfers:
+            ix = spl_token.transfer(
+                spl_token.TransferParams(
+                    program_id=self.program_id,
+                    source=source,
+                    dest=dest,
+                    owner=owner_pubkey,
+                    amount=amount,
+                    signers=signer_pubkeys,
+                )
+            )
+            if ixs:
+                # Another transfer with the same signers adds its new account keys and its compiled instruction:
+                # a program index, an account count, one index per account, a data length and the data. Every
+                # count fits in a one-byte shortvec, since 128 keys or instructions would not fit in a packet.
+                new_keys = {meta.pubkey for meta in ix.accounts} - keys
+                grown = size + 32 * len(new_keys) + 3 + len(ix.accounts) + len(ix.data)
+                if grown <= _PACKET_DATA_SIZE:
+                    ixs.append(ix)
+                    keys |= new_keys
+                    size = grown
+                    continue
+                batches.append(ixs)
+            msg = Message.new_with_blockhash([ix], payer_pubkey, recent_blockhash)
+            # A shortvec signature count followed by one 64-byte signature per signer.
+            size = 1 + 64 * msg.header.num_required_signatures + len(bytes(msg))
+            if size > _PACKET_DATA_SIZE:
+                raise ValueError(
+                    f"a single transfer needs a {size}-byte transaction, over the {_PACKET_DATA_SIZE}-byte limit"
+                )
+            ixs = [ix]
+            keys = set(msg.account_keys)
+        if ixs:
+            batches.append(ixs)
+        tx_signers = [self.payer, *signers]
+        return [_build_tx(batch, tx_signers, payer_pubkey, recent_blockhash) for batch in batches], opts
+
     def _set_authority_args(
         self,
         account: Pubkey,
@@ -294,12 +605,7 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, Keypair, List[Keypair], TxOpts]:
-        if isinstance(current_authority, Keypair):
-            current_authority_pubkey = current_authority.pubkey()
-            signers = [current_authority]
-        else:
-            current_authority_pubkey = current_authority
-            signers = multi_signers if multi_signers else []
+        current_authority_pubkey, signers, signer_pubkeys = self._resolve_authority(current_authority, multi_signers)
         ixs = [
             spl_token.set_authority(
                 spl_token.SetAuthorityParams(
@@ -307,13 +613,12 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
                     account=account,
                     authority=authority_type,
                     current_authority=current_authority_pubkey,
-                    signers=[signer.pubkey() for signer in signers],
+                    signers=signer_pubkeys,
                     new_authority=new_authority,
                 )
             )
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer], msg, recent_blockhash)
+        txn = _build_tx(ixs, self._payer_signers, self._payer_pubkey, recent_blockhash)
 
         return txn, self.payer, signers, opts
 
@@ -326,12 +631,7 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, TxOpts]:
-        if isinstance(mint_authority, Keypair):
-            owner_pubkey = mint_authority.pubkey()
-            signers = [mint_authority]
-        else:
-            owner_pubkey = mint_authority
-            signers = multi_signers if multi_signers else []
+        owner_pubkey, signers, signer_pubkeys = self._resolve_authority(mint_authority, multi_signers)
         ixs = [
             spl_token.mint_to(
                 spl_token.MintToParams(
@@ -340,16 +640,17 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
                     dest=dest,
                     mint_authority=owner_pubkey,
                     amount=amount,
-                    signers=[signer.pubkey() for signer in signers],
+                    signers=signer_pubkeys,
                 )
             )
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer], msg, recent_blockhash)
+        txn = _build_tx(ixs, self._payer_signers, self._payer_pubkey, recent_blockhash)
         return txn, opts
 
     def _create_mint_info(self, info: GetAccountInfoResp) -> MintInfo:
-        value = info.value
+        return self._decode_mint_info(info.value)
+
+    def _decode_mint_info(self, value: Optional[Account]) -> MintInfo:
         if value is None:
             raise ValueError("Failed to find mint account")
         owner = value.owner
@@ -357,71 +658,127 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
             raise AttributeError(f"Invalid mint owner: {owner}")
 
         bytes_data = value.data
-        if len(bytes_data) != MINT_LAYOUT.sizeof():
+        if len(bytes_data) != MINT_LEN:
             raise ValueError("Invalid mint size")
 
-        decoded_data = MINT_LAYOUT.parse(bytes_data)
-        decimals = decoded_data.decimals
-
-        mint_authority = None if decoded_data.mint_authority_option == 0 else Pubkey(decoded_data.mint_authority)
+        (
+            mint_authority_option,
+            mint_authority_bytes,
+            supply,
+            decimals,
+            initialized,
+            freeze_authority_option,
+            freeze_authority_bytes,
+        ) = MINT_STRUCT.unpack(bytes_data)
 
-        supply = decoded_data.supply
-        is_initialized = decoded_data.is_initialized != 0
-
-        freeze_authority = None if decoded_data.freeze_authority_option == 0 else Pubkey(decoded_data.freeze_authority)
+        mint_authority = None if mint_authority_option == 0 else Pubkey.from_bytes(mint_authority_bytes)
+        is_initialized = initialized != 0
+        freeze_authority = None if freeze_authority_option == 0 else Pubkey.from_bytes(freeze_authority_bytes)
 
         return MintInfo(mint_authority, supply, decimals, is_initialized, freeze_authority)
 
     def _create_account_info(self, info: GetAccountInfoResp) -> AccountInfo:
-        value = info.value
+        return self._decode_account_info(info.value)
+
+    def _decode_account_info(self, value: Optional[Account]) -> AccountInfo:
         if value is None:
             raise ValueError("Invalid account owner")
         if value.owner != self.program_id:
             raise AttributeError("Invalid account owner")
 
         bytes_data = value.data
-        if len(bytes_data) != ACCOUNT_LAYOUT.sizeof():
+        if len(bytes_data) != ACCOUNT_LEN:
             raise ValueError("Invalid account size")
 
-        decoded_data = ACCOUNT_LAYOUT.parse(bytes_data)
+        return self._parse_account_data(bytes_data)
 
-        mint = Pubkey(decoded_data.mint)
-        owner = Pubkey(decoded_data.owner)
-        amount = decoded_data.amount
+    def _create_account_infos(self, resp: GetMultipleAccountsResp) -> List[Optional[AccountInfo]]:
+        return self._decode_account_infos(resp.value)
 
-        if decoded_data.delegate_option == 0:
+    def _decode_account_infos(self, values: Sequence[Optional[Account]]) -> List[Optional[AccountInfo]]:
+        program_id = self.program_id
+        infos: List[Optional[AccountInfo]] = []
+        for value in values:
+            if value is None:
+                infos.append(None)
+                continue
+            if value.owner != program_id:
+                raise AttributeError("Invalid account owner")
+            bytes_data = value.data
+            if len(bytes_data) != ACCOUNT_LEN:
+                raise ValueError("Invalid account size")
+            infos.append(self._parse_account_data(bytes_data))
+        return infos
+
+    def _mint_and_accounts_keys(self, accounts: Sequence[Pubkey]) -> List[Pubkey]:
+        # The mint takes one of the slots of the single getMultipleAccounts request.
+        if len(accounts) >= _MAX_MULTIPLE_ACCOUNTS:
+            raise ValueError(
+                f"At most {_MAX_MULTIPLE_ACCOUNTS - 1} accounts can be fetched with the mint, got {len(accounts)}"
+            )
+        return [self.pubkey, *accounts]
+
+    def _decode_mint_and_accounts(self, resp: GetMultipleAccountsResp) -> Tuple[MintInfo, List[Optional[AccountInfo]]]:
+        mint_value, *account_values = resp.value
+        return self._decode_mint_info(mint_value), self._decode_account_infos(account_values)
+
+    def _parse_account_data(self, bytes_data: bytes) -> AccountInfo:
+        (
+            mint_bytes,
+            owner_bytes,
+            amount,
+            delegate_option,
+            delegate_bytes,
+            state,
+            is_native_option,
+            native_reserve,
+            delegated_amount,
+            close_authority_option,
+            close_authority_bytes,
+        ) = ACCOUNT_STRUCT.unpack(bytes_data)
+
+        # Check the mint on the raw bytes so a mismatch fails before any Pubkey is built. The struct fields
+        # are always 32 bytes long, which is what the faster Pubkey.from_bytes requires.
+        if mint_bytes != self._pubkey_bytes:
+            raise AttributeError(f"Invalid account mint: {Pubkey.from_bytes(mint_bytes)} != {self.pubkey}")
+
+        mint = self.pubkey
+        owner = Pubkey.from_bytes(owner_bytes)
+
+        if delegate_option == 0:
             delegate = None
             delegated_amount = 0
         else:
-            delegate = Pubkey(decoded_data.delegate)
-            delegated_amount = decoded_data.delegated_amount
+            delegate = Pubkey.from_bytes(delegate_bytes)
 
-        is_initialized = decoded_data.state != 0
-        is_frozen = decoded_data.state == 2  # noqa: PLR2004
+        try:
+            is_initialized, is_frozen = _ACCOUNT_STATES[state]
+        except IndexError:
+            raise ValueError(f"Invalid account state: {state}") from None
 
-        if decoded_data.is_native_option == 1:
-            rent_exempt_reserve = decoded_data.is_native
+        if is_native_option == 1:
+            rent_exempt_reserve = native_reserve
             is_native = True
         else:
             rent_exempt_reserve = None
             is_native = False
 
-        close_authority = None if decoded_data.close_authority_option == 0 else Pubkey(decoded_data.owner)
-
-        if mint != self.pubkey:
-            raise AttributeError(f"Invalid account mint: {decoded_data.mint} != {self.pubkey}")
+        close_authority = None if close_authority_option == 0 else Pubkey.from_bytes(close_authority_bytes)
 
-        return AccountInfo(
-            mint,
-            owner,
-            amount,
-            delegate,
-            delegated_amount,
-            is_initialized,
-            is_frozen,
-            is_native,
-            rent_exempt_reserve,
-            close_authority,
+        # _make skips the keyword-handling __new__ that a positional NamedTuple call goes through.
+        return AccountInfo._make(
+            (
+                mint,
+                owner,
+                amount,
+                delegate,
+                delegated_amount,
+                is_initialized,
+                is_frozen,
+                is_native,
+                rent_exempt_reserve,
+                close_authority,
+            )
         )
 
     def _approve_args(
@@ -434,12 +791,7 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, Keypair, List[Keypair], TxOpts]:
-        if isinstance(owner, Keypair):
-            owner_pubkey = owner.pubkey()
-            signers = [owner]
-        else:
-            owner_pubkey = owner
-            signers = multi_signers if multi_signers else []
+        owner_pubkey, signers, signer_pubkeys = self._resolve_authority(owner, multi_signers)
         ixs = [
             spl_token.approve(
                 spl_token.ApproveParams(
@@ -448,12 +800,11 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
                     delegate=delegate,
                     owner=owner_pubkey,
                     amount=amount,
-                    signers=[signer.pubkey() for signer in signers],
+                    signers=signer_pubkeys,
                 )
             )
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer], msg, recent_blockhash)
+        txn = _build_tx(ixs, self._payer_signers, self._payer_pubkey, recent_blockhash)
         return txn, self.payer, signers, opts
 
     def _revoke_args(
@@ -464,24 +815,18 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, Keypair, List[Keypair], TxOpts]:
-        if isinstance(owner, Keypair):
-            owner_pubkey = owner.pubkey()
-            signers = [owner]
-        else:
-            owner_pubkey = owner
-            signers = multi_signers if multi_signers else []
+        owner_pubkey, signers, signer_pubkeys = self._resolve_authority(owner, multi_signers)
         ixs = [
             spl_token.revoke(
                 spl_token.RevokeParams(
                     program_id=self.program_id,
                     account=account,
                     owner=owner_pubkey,
-                    signers=[signer.pubkey() for signer in signers],
+                    signers=signer_pubkeys,
                 )
             )
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer], msg, recent_blockhash)
+        txn = _build_tx(ixs, self._payer_signers, self._payer_pubkey, recent_blockhash)
         return txn, self.payer, signers, opts
 
     def _freeze_account_args(
@@ -492,13 +837,7 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, TxOpts]:
-        if isinstance(authority, Keypair):
-            authority_pubkey = authority.pubkey()
-            base_signers = [authority]
-        else:
-            authority_pubkey = authority
-            base_signers = multi_signers if multi_signers else []
-        fee_payer_keypair = self.payer
+        authority_pubkey, base_signers, signer_pubkeys = self._resolve_authority(authority, multi_signers)
         ixs = [
             spl_token.freeze_account(
                 spl_token.FreezeAccountParams(
@@ -506,13 +845,13 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
                     account=account,
                     mint=self.pubkey,
                     authority=authority_pubkey,
-                    multi_signers=[signer.pubkey() for signer in base_signers],
+                    multi_signers=signer_pubkeys,
                 )
             )
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        signers = list(set(base_signers) | {fee_payer_keypair})
-        txn = Transaction(signers, msg, recent_blockhash)
+        # De-duplicate, keeping the fee payer first.
+        signers = list(dict.fromkeys((self.payer, *base_signers)))
+        txn = _build_tx(ixs, signers, self._payer_pubkey, recent_blockhash)
         return txn, opts
 
     def _thaw_account_args(
@@ -523,13 +862,7 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, TxOpts]:
-        if isinstance(authority, Keypair):
-            authority_pubkey = authority.pubkey()
-            base_signers = [authority]
-        else:
-            authority_pubkey = authority
-            base_signers = multi_signers if multi_signers else []
-        fee_payer_keypair = self.payer
+        authority_pubkey, base_signers, signer_pubkeys = self._resolve_authority(authority, multi_signers)
         ixs = [
             spl_token.thaw_account(
                 spl_token.ThawAccountParams(
@@ -537,13 +870,13 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
                     account=account,
                     mint=self.pubkey,
                     authority=authority_pubkey,
-                    multi_signers=[signer.pubkey() for signer in base_signers],
+                    multi_signers=signer_pubkeys,
                 )
             )
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        signers = list(set(base_signers) | {fee_payer_keypair})
-        txn = Transaction(signers, msg, recent_blockhash)
+        # De-duplicate, keeping the fee payer first.
+        signers = list(dict.fromkeys((self.payer, *base_signers)))
+        txn = _build_tx(ixs, signers, self._payer_pubkey, recent_blockhash)
         return txn, opts
 
     def _close_account_args(
@@ -555,12 +888,7 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, TxOpts]:
-        if isinstance(authority, Keypair):
-            authority_pubkey = authority.pubkey()
-            signers = [authority]
-        else:
-            authority_pubkey = authority
-            signers = multi_signers if multi_signers else []
+        authority_pubkey, signers, signer_pubkeys = self._resolve_authority(authority, multi_signers)
         ixs = [
             spl_token.close_account(
                 spl_token.CloseAccountParams(
@@ -568,12 +896,11 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
                     account=account,
                     dest=dest,
                     owner=authority_pubkey,
-                    signers=[signer.pubkey() for signer in signers],
+                    signers=signer_pubkeys,
                 )
             )
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer], msg, recent_blockhash)
+        txn = _build_tx(ixs, self._payer_signers, self._payer_pubkey, recent_blockhash)
         return txn, opts
 
     def _burn_args(
@@ -585,12 +912,7 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, TxOpts]:
-        if isinstance(owner, Keypair):
-            owner_pubkey = owner.pubkey()
-            signers = [owner]
-        else:
-            owner_pubkey = owner
-            signers = multi_signers if multi_signers else []
+        owner_pubkey, signers, signer_pubkeys = self._resolve_authority(owner, multi_signers)
         ixs = [
             spl_token.burn(
                 spl_token.BurnParams(
@@ -599,39 +921,38 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
                     mint=self.pubkey,
                     owner=owner_pubkey,
                     amount=amount,
-                    signers=[signer.pubkey() for signer in signers],
+                    signers=signer_pubkeys,
                 )
             )
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer], msg, recent_blockhash)
+        txn = _build_tx(ixs, self._payer_signers, self._payer_pubkey, recent_blockhash)
         return txn, opts
 
     def _create_multisig_args(
         self, m: int, signers: List[Pubkey], balance_needed: int, recent_blockhash: Blockhash
     ) -> Tuple[Transaction, Keypair]:
         multisig_keypair = Keypair()
+        multisig_pubkey = multisig_keypair.pubkey()
         ixs = [
             sp.create_account(
                 sp.CreateAccountParams(
-                    from_pubkey=self.payer.pubkey(),
-                    to_pubkey=multisig_keypair.pubkey(),
+                    from_pubkey=self._payer_pubkey,
+                    to_pubkey=multisig_pubkey,
                     lamports=balance_needed,
-                    space=MULTISIG_LAYOUT.sizeof(),
+                    space=MULTISIG_LEN,
                     owner=self.program_id,
                 )
             ),
             spl_token.initialize_multisig(
                 spl_token.InitializeMultisigParams(
                     program_id=self.program_id,
-                    multisig=multisig_keypair.pubkey(),
+                    multisig=multisig_pubkey,
                     m=m,
                     signers=signers,
                 )
             ),
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer, multisig_keypair], msg, recent_blockhash)
+        txn = _build_tx(ixs, [self.payer, multisig_keypair], self._payer_pubkey, recent_blockhash)
         return txn, multisig_keypair
 
     def _transfer_checked_args(
@@ -645,12 +966,7 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, TxOpts]:
-        if isinstance(owner, Keypair):
-            owner_pubkey = owner.pubkey()
-            signers = [owner]
-        else:
-            owner_pubkey = owner
-            signers = multi_signers if multi_signers else []
+        owner_pubkey, signers, signer_pubkeys = self._resolve_authority(owner, multi_signers)
         ixs = [
             spl_token.transfer_checked(
                 spl_token.TransferCheckedParams(
@@ -661,12 +977,11 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
                     owner=owner_pubkey,
                     amount=amount,
                     decimals=decimals,
-                    signers=[signer.pubkey() for signer in signers],
+                    signers=signer_pubkeys,
                 )
             )
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer, *signers], msg, recent_blockhash)
+        txn = _build_tx(ixs, [self.payer, *signers], self._payer_pubkey, recent_blockhash)
         return txn, opts
 
     def _mint_to_checked_args(
@@ -679,12 +994,7 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, TxOpts]:
-        if isinstance(mint_authority, Keypair):
-            owner_pubkey = mint_authority.pubkey()
-            signers = [mint_authority]
-        else:
-            owner_pubkey = mint_authority
-            signers = multi_signers if multi_signers else []
+        owner_pubkey, signers, signer_pubkeys = self._resolve_authority(mint_authority, multi_signers)
         ixs = [
             spl_token.mint_to_checked(
                 spl_token.MintToCheckedParams(
@@ -694,12 +1004,11 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
                     mint_authority=owner_pubkey,
                     amount=amount,
                     decimals=decimals,
-                    signers=[signer.pubkey() for signer in signers],
+                    signers=signer_pubkeys,
                 )
             )
         ]
-        msg = Message.new_with_blockhash(ixs, self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer], msg, recent_blockhash)
+        txn = _build_tx(ixs, self._payer_signers, self._payer_pubkey, recent_blockhash)
         return txn, opts
 
     def _burn_checked_args(
@@ -712,12 +1021,7 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, TxOpts]:
-        if isinstance(owner, Keypair):
-            owner_pubkey = owner.pubkey()
-            signers = [owner]
-        else:
-            owner_pubkey = owner
-            signers = multi_signers if multi_signers else []
+        owner_pubkey, signers, signer_pubkeys = self._resolve_authority(owner, multi_signers)
         ix = spl_token.burn_checked(
             spl_token.BurnCheckedParams(
                 program_id=self.program_id,
@@ -726,11 +1030,10 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
                 owner=owner_pubkey,
                 amount=amount,
                 decimals=decimals,
-                signers=[signer.pubkey() for signer in signers],
+                signers=signer_pubkeys,
             )
         )
-        msg = Message.new_with_blockhash([ix], self.payer.pubkey(), recent_blockhash)
-        txn = Transaction(signers, msg, recent_blockhash)
+        txn = _build_tx((ix,), signers, self._payer_pubkey, recent_blockhash)
         return txn, opts
 
     def _approve_checked_args(
@@ -744,12 +1047,7 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
         opts: TxOpts,
         recent_blockhash: Blockhash,
     ) -> Tuple[Transaction, TxOpts]:
-        if isinstance(owner, Keypair):
-            owner_pubkey = owner.pubkey()
-            signers = [owner]
-        else:
-            owner_pubkey = owner
-            signers = multi_signers if multi_signers else []
+        owner_pubkey, signers, signer_pubkeys = self._resolve_authority(owner, multi_signers)
         ix = spl_token.approve_checked(
             spl_token.ApproveCheckedParams(
                 program_id=self.program_id,
@@ -759,9 +1057,8 @@ class _TokenCore:  # pylint: disable=too-few-public-methods
                 owner=owner_pubkey,
                 amount=amount,
                 decimals=decimals,
-                signers=[signer.pubkey() for signer in signers],
+                signers=signer_pubkeys,
             )
         )
-        msg = Message.new_with_blockhash([ix], self.payer.pubkey(), recent_blockhash)
-        txn = Transaction([self.payer], msg, recent_blockhash)
+        txn = _build_tx((ix,), self._payer_signers, self._payer_pubkey, recent_blockhash)
         return txn, opts
@@ -1,17 +1,62 @@
 """SPL token instructions."""  # pylint: disable=too-many-lines
 
 from enum import IntEnum
-from typing import Any, List, NamedTuple, Optional, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
 
 from solders.instruction import AccountMeta, Instruction
 from solders.pubkey import Pubkey
 from solders.system_program import ID as SYS_PROGRAM_ID
 from solders.sysvar import RENT
 
-from solana.utils.validate import validate_instruction_keys, validate_instruction_type
-from spl.token._layouts import INSTRUCTIONS_LAYOUT, InstructionType
+from spl.token._layouts import (
+    AMOUNT2_STRUCT,
+    AMOUNT_STRUCT,
+    INITIALIZE_MINT_STRUCT,
+    INITIALIZE_MULTISIG_STRUCT,
+    INSTRUCTIONS_LAYOUT,
+    SET_AUTHORITY_STRUCT,
+    InstructionType,
+)
 from spl.token.constants import ASSOCIATED_TOKEN_PROGRAM_ID, TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID
 
+_ZERO_PUBKEY_BYTES = bytes(32)
+"""Placeholder encoded in place of an absent optional authority."""
+
+# AccountMeta is immutable, so the metas for fixed program and sysvar accounts are shared between instructions.
+# The builders pass AccountMeta and Instruction arguments positionally: solders' keyword parsing roughly doubles
+# the cost of constructing either.
+_RENT_META = AccountMeta(RENT, False, False)
+_SYS_PROGRAM_META = AccountMeta(SYS_PROGRAM_ID, False, False)
+_TOKEN_PROGRAM_META = AccountMeta(TOKEN_PROGRAM_ID, False, False)
+
+# Instructions without arguments always serialize to the same bytes, so build them once.
+_INITIALIZE_ACCOUNT_DATA = INSTRUCTIONS_LAYOUT.build(
+    {"instruction_type": InstructionType.INITIALIZE_ACCOUNT, "args": None}
+)
+_REVOKE_DATA = INSTRUCTIONS_LAYOUT.build({"instruction_type": InstructionType.REVOKE, "args": None})
+_CLOSE_ACCOUNT_DATA = INSTRUCTIONS_LAYOUT.build({"instruction_type": InstructionType.CLOSE_ACCOUNT, "args": None})
+_FREEZE_ACCOUNT_DATA = INSTRUCTIONS_LAYOUT.build({"instruction_type": InstructionType.FREEZE_ACCOUNT, "args": None})
+_THAW_ACCOUNT_DATA = INSTRUCTIONS_LAYOUT.build({"instruction_type": InstructionType.THAW_ACCOUNT, "args": None})
+_SYNC_NATIVE_DATA = INSTRUCTIONS_LAYOUT.build({"instruction_type": InstructionType.SYNC_NATIVE, "args": {}})
+
+# Plain-int instruction tags: reading an enum member is a descriptor lookup that costs more than the pack it feeds.
+_TAG_INITIALIZE_MINT = int(InstructionType.INITIALIZE_MINT)
+_TAG_INITIALIZE_ACCOUNT = int(InstructionType.INITIALIZE_ACCOUNT)
+_TAG_INITIALIZE_MULTISIG = int(InstructionType.INITIALIZE_MULTISIG)
+_TAG_TRANSFER = int(InstructionType.TRANSFER)
+_TAG_APPROVE = int(InstructionType.APPROVE)
+_TAG_REVOKE = int(InstructionType.REVOKE)
+_TAG_SET_AUTHORITY = int(InstructionType.SET_AUTHORITY)
+_TAG_MINT_TO = int(InstructionType.MINT_TO)
+_TAG_BURN = int(InstructionType.BURN)
+_TAG_CLOSE_ACCOUNT = int(InstructionType.CLOSE_ACCOUNT)
+_TAG_FREEZE_ACCOUNT = int(InstructionType.FREEZE_ACCOUNT)
+_TAG_THAW_ACCOUNT = int(InstructionType.THAW_ACCOUNT)
+_TAG_TRANSFER2 = int(InstructionType.TRANSFER2)
+_TAG_APPROVE2 = int(InstructionType.APPROVE2)
+_TAG_MINT_TO2 = int(InstructionType.MINT_TO2)
+_TAG_BURN2 = int(InstructionType.BURN2)
+
 
 class AuthorityType(IntEnum):
     """Specifies the authority type for SetAuthority instructions."""
@@ -26,6 +71,18 @@ class AuthorityType(IntEnum):
     """Authority to close a token account."""
 
 
+_AUTHORITY_TYPES = tuple(AuthorityType)
+"""Authority types indexed by their value."""
+
+
+def _authority_type(value: int) -> AuthorityType:
+    # Indexing skips the EnumMeta.__call__ lookup; negative values never come out of the u8 layout.
+    try:
+        return _AUTHORITY_TYPES[value]
+    except IndexError:
+        raise ValueError(f"{value} is not a valid AuthorityType") from None
+
+
 # Instruction Params
 class InitializeMintParams(NamedTuple):
     """Initialize token mint transaction params."""
@@ -300,14 +357,25 @@ class SyncNativeParams(NamedTuple):
     """Account to sync."""
 
 
-def __parse_and_validate_instruction(
+def __key_count_error(accounts: List[AccountMeta], expected: int) -> ValueError:
+    # Same message as validate_instruction_keys, for an accounts list the decoder has already read.
+    return ValueError(f"invalid instruction: found {len(accounts)} keys, expected at least {expected}")
+
+
+def __validate_instruction(
     instruction: Instruction,
+    accounts: List[AccountMeta],
     expected_keys: int,
-    expected_type: InstructionType,
-) -> Any:  # Returns a Construct container.
-    validate_instruction_keys(instruction, expected_keys)
-    data = INSTRUCTIONS_LAYOUT.parse(instruction.data)
-    validate_instruction_type(data, expected_type)
+    expected_type: int,
+) -> bytes:
+    # The checks are inline so that a valid instruction costs no further calls.
+    if len(accounts) < expected_keys:
+        raise __key_count_error(accounts, expected_keys)
+    data = instruction.data
+    # The tag is checked before any arguments are unpacked, so a mismatched instruction reports the type error.
+    instruction_type = data[0] if data else None
+    if instruction_type != expected_type:
+        raise ValueError(f"invalid instruction; instruction index mismatch {instruction_type} != {expected_type}")
     return data
 
 
@@ -320,15 +388,17 @@ def decode_initialize_mint(instruction: Instruction) -> InitializeMintParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 2, InstructionType.INITIALIZE_MINT)
+    # Instruction.accounts builds a new list on every access, so the decoders read it once.
+    accounts = instruction.accounts
+    _, decimals, mint_authority, freeze_authority_option, freeze_authority = INITIALIZE_MINT_STRUCT.unpack_from(
+        __validate_instruction(instruction, accounts, 2, _TAG_INITIALIZE_MINT)
+    )
     return InitializeMintParams(
-        decimals=parsed_data.args.decimals,
+        decimals=decimals,
         program_id=instruction.program_id,
-        mint=instruction.accounts[0].pubkey,
-        mint_authority=Pubkey(parsed_data.args.mint_authority),
-        freeze_authority=Pubkey(parsed_data.args.freeze_authority)
-        if parsed_data.args.freeze_authority_option
-        else None,
+        mint=accounts[0].pubkey,
+        mint_authority=Pubkey.from_bytes(mint_authority),
+        freeze_authority=Pubkey.from_bytes(freeze_authority) if freeze_authority_option else None,
     )
 
 
@@ -341,12 +411,13 @@ def decode_initialize_account(instruction: Instruction) -> InitializeAccountPara
     Returns:
         The decoded instruction.
     """
-    _ = __parse_and_validate_instruction(instruction, 4, InstructionType.INITIALIZE_ACCOUNT)
+    accounts = instruction.accounts
+    __validate_instruction(instruction, accounts, 4, _TAG_INITIALIZE_ACCOUNT)
     return InitializeAccountParams(
         program_id=instruction.program_id,
-        account=instruction.accounts[0].pubkey,
-        mint=instruction.accounts[1].pubkey,
-        owner=instruction.accounts[2].pubkey,
+        account=accounts[0].pubkey,
+        mint=accounts[1].pubkey,
+        owner=accounts[2].pubkey,
     )
 
 
@@ -359,13 +430,17 @@ def decode_initialize_multisig(instruction: Instruction) -> InitializeMultisigPa
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 2, InstructionType.INITIALIZE_MULTISIG)
-    num_signers = parsed_data.args.m
-    validate_instruction_keys(instruction, 2 + num_signers)
+    accounts = instruction.accounts
+    _, num_signers = INITIALIZE_MULTISIG_STRUCT.unpack_from(
+        __validate_instruction(instruction, accounts, 2, _TAG_INITIALIZE_MULTISIG)
+    )
+    if len(accounts) < 2 + num_signers:
+        raise __key_count_error(accounts, 2 + num_signers)
     return InitializeMultisigParams(
         program_id=instruction.program_id,
-        multisig=instruction.accounts[0].pubkey,
-        signers=[signer.pubkey for signer in instruction.accounts[-num_signers:]],
+        multisig=accounts[0].pubkey,
+        # Slicing from len(accounts) rather than -num_signers keeps m == 0 from selecting every account.
+        signers=[signer.pubkey for signer in accounts[len(accounts) - num_signers :]],
         m=num_signers,
     )
 
@@ -379,14 +454,15 @@ def decode_transfer(instruction: Instruction) -> TransferParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.TRANSFER)
+    accounts = instruction.accounts
+    _, amount = AMOUNT_STRUCT.unpack_from(__validate_instruction(instruction, accounts, 3, _TAG_TRANSFER))
     return TransferParams(
         program_id=instruction.program_id,
-        source=instruction.accounts[0].pubkey,
-        dest=instruction.accounts[1].pubkey,
-        owner=instruction.accounts[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.accounts[3:]],
-        amount=parsed_data.args.amount,
+        source=accounts[0].pubkey,
+        dest=accounts[1].pubkey,
+        owner=accounts[2].pubkey,
+        signers=[signer.pubkey for signer in accounts[3:]],
+        amount=amount,
     )
 
 
@@ -399,14 +475,15 @@ def decode_approve(instruction: Instruction) -> ApproveParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.APPROVE)
+    accounts = instruction.accounts
+    _, amount = AMOUNT_STRUCT.unpack_from(__validate_instruction(instruction, accounts, 3, _TAG_APPROVE))
     return ApproveParams(
         program_id=instruction.program_id,
-        source=instruction.accounts[0].pubkey,
-        delegate=instruction.accounts[1].pubkey,
-        owner=instruction.accounts[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.accounts[3:]],
-        amount=parsed_data.args.amount,
+        source=accounts[0].pubkey,
+        delegate=accounts[1].pubkey,
+        owner=accounts[2].pubkey,
+        signers=[signer.pubkey for signer in accounts[3:]],
+        amount=amount,
     )
 
 
@@ -419,12 +496,13 @@ def decode_revoke(instruction: Instruction) -> RevokeParams:
     Returns:
         The decoded instruction.
     """
-    _ = __parse_and_validate_instruction(instruction, 2, InstructionType.REVOKE)
+    accounts = instruction.accounts
+    __validate_instruction(instruction, accounts, 2, _TAG_REVOKE)
     return RevokeParams(
         program_id=instruction.program_id,
-        account=instruction.accounts[0].pubkey,
-        owner=instruction.accounts[1].pubkey,
-        signers=[signer.pubkey for signer in instruction.accounts[2:]],
+        account=accounts[0].pubkey,
+        owner=accounts[1].pubkey,
+        signers=[signer.pubkey for signer in accounts[2:]],
     )
 
 
@@ -437,14 +515,17 @@ def decode_set_authority(instruction: Instruction) -> SetAuthorityParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 2, InstructionType.SET_AUTHORITY)
+    accounts = instruction.accounts
+    _, authority_type, new_authority_option, new_authority = SET_AUTHORITY_STRUCT.unpack_from(
+        __validate_instruction(instruction, accounts, 2, _TAG_SET_AUTHORITY)
+    )
     return SetAuthorityParams(
         program_id=instruction.program_id,
-        account=instruction.accounts[0].pubkey,
-        authority=AuthorityType(parsed_data.args.authority_type),
-        new_authority=Pubkey(parsed_data.args.new_authority) if parsed_data.args.new_authority_option else None,
-        current_authority=instruction.accounts[1].pubkey,
-        signers=[signer.pubkey for signer in instruction.accounts[2:]],
+        account=accounts[0].pubkey,
+        authority=_authority_type(authority_type),
+        new_authority=Pubkey.from_bytes(new_authority) if new_authority_option else None,
+        current_authority=accounts[1].pubkey,
+        signers=[signer.pubkey for signer in accounts[2:]],
     )
 
 
@@ -457,14 +538,15 @@ def decode_mint_to(instruction: Instruction) -> MintToParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.MINT_TO)
+    accounts = instruction.accounts
+    _, amount = AMOUNT_STRUCT.unpack_from(__validate_instruction(instruction, accounts, 3, _TAG_MINT_TO))
     return MintToParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        mint=instruction.accounts[0].pubkey,
-        dest=instruction.accounts[1].pubkey,
-        mint_authority=instruction.accounts[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.accounts[3:]],
+        amount=amount,
+        mint=accounts[0].pubkey,
+        dest=accounts[1].pubkey,
+        mint_authority=accounts[2].pubkey,
+        signers=[signer.pubkey for signer in accounts[3:]],
     )
 
 
@@ -477,14 +559,15 @@ def decode_burn(instruction: Instruction) -> BurnParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.BURN)
+    accounts = instruction.accounts
+    _, amount = AMOUNT_STRUCT.unpack_from(__validate_instruction(instruction, accounts, 3, _TAG_BURN))
     return BurnParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        account=instruction.accounts[0].pubkey,
-        mint=instruction.accounts[1].pubkey,
-        owner=instruction.accounts[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.accounts[3:]],
+        amount=amount,
+        account=accounts[0].pubkey,
+        mint=accounts[1].pubkey,
+        owner=accounts[2].pubkey,
+        signers=[signer.pubkey for signer in accounts[3:]],
     )
 
 
@@ -497,13 +580,14 @@ def decode_close_account(instruction: Instruction) -> CloseAccountParams:
     Returns:
         The decoded instruction.
     """
-    _ = __parse_and_validate_instruction(instruction, 3, InstructionType.CLOSE_ACCOUNT)
+    accounts = instruction.accounts
+    __validate_instruction(instruction, accounts, 3, _TAG_CLOSE_ACCOUNT)
     return CloseAccountParams(
         program_id=instruction.program_id,
-        account=instruction.accounts[0].pubkey,
-        dest=instruction.accounts[1].pubkey,
-        owner=instruction.accounts[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.accounts[3:]],
+        account=accounts[0].pubkey,
+        dest=accounts[1].pubkey,
+        owner=accounts[2].pubkey,
+        signers=[signer.pubkey for signer in accounts[3:]],
     )
 
 
@@ -516,13 +600,14 @@ def decode_freeze_account(instruction: Instruction) -> FreezeAccountParams:
     Returns:
         The decoded instruction.
     """
-    _ = __parse_and_validate_instruction(instruction, 3, InstructionType.FREEZE_ACCOUNT)
+    accounts = instruction.accounts
+    __validate_instruction(instruction, accounts, 3, _TAG_FREEZE_ACCOUNT)
     return FreezeAccountParams(
         program_id=instruction.program_id,
-        account=instruction.accounts[0].pubkey,
-        mint=instruction.accounts[1].pubkey,
-        authority=instruction.accounts[2].pubkey,
-        multi_signers=[signer.pubkey for signer in instruction.accounts[3:]],
+        account=accounts[0].pubkey,
+        mint=accounts[1].pubkey,
+        authority=accounts[2].pubkey,
+        multi_signers=[signer.pubkey for signer in accounts[3:]],
     )
 
 
@@ -535,13 +620,14 @@ def decode_thaw_account(instruction: Instruction) -> ThawAccountParams:
     Returns:
         The decoded instruction.
     """
-    _ = __parse_and_validate_instruction(instruction, 3, InstructionType.THAW_ACCOUNT)
+    accounts = instruction.accounts
+    __validate_instruction(instruction, accounts, 3, _TAG_THAW_ACCOUNT)
     return ThawAccountParams(
         program_id=instruction.program_id,
-        account=instruction.accounts[0].pubkey,
-        mint=instruction.accounts[1].pubkey,
-        authority=instruction.accounts[2].pubkey,
-        multi_signers=[signer.pubkey for signer in instruction.accounts[3:]],
+        account=accounts[0].pubkey,
+        mint=accounts[1].pubkey,
+        authority=accounts[2].pubkey,
+        multi_signers=[signer.pubkey for signer in accounts[3:]],
     )
 
 
@@ -554,16 +640,17 @@ def decode_transfer_checked(instruction: Instruction) -> TransferCheckedParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 4, InstructionType.TRANSFER2)
+    accounts = instruction.accounts
+    _, amount, decimals = AMOUNT2_STRUCT.unpack_from(__validate_instruction(instruction, accounts, 4, _TAG_TRANSFER2))
     return TransferCheckedParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        decimals=parsed_data.args.decimals,
-        source=instruction.accounts[0].pubkey,
-        mint=instruction.accounts[1].pubkey,
-        dest=instruction.accounts[2].pubkey,
-        owner=instruction.accounts[3].pubkey,
-        signers=[signer.pubkey for signer in instruction.accounts[4:]],
+        amount=amount,
+        decimals=decimals,
+        source=accounts[0].pubkey,
+        mint=accounts[1].pubkey,
+        dest=accounts[2].pubkey,
+        owner=accounts[3].pubkey,
+        signers=[signer.pubkey for signer in accounts[4:]],
     )
 
 
@@ -576,16 +663,17 @@ def decode_approve_checked(instruction: Instruction) -> ApproveCheckedParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 4, InstructionType.APPROVE2)
+    accounts = instruction.accounts
+    _, amount, decimals = AMOUNT2_STRUCT.unpack_from(__validate_instruction(instruction, accounts, 4, _TAG_APPROVE2))
     return ApproveCheckedParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        decimals=parsed_data.args.decimals,
-        source=instruction.accounts[0].pubkey,
-        mint=instruction.accounts[1].pubkey,
-        delegate=instruction.accounts[2].pubkey,
-        owner=instruction.accounts[3].pubkey,
-        signers=[signer.pubkey for signer in instruction.accounts[4:]],
+        amount=amount,
+        decimals=decimals,
+        source=accounts[0].pubkey,
+        mint=accounts[1].pubkey,
+        delegate=accounts[2].pubkey,
+        owner=accounts[3].pubkey,
+        signers=[signer.pubkey for signer in accounts[4:]],
     )
 
 
@@ -598,15 +686,16 @@ def decode_mint_to_checked(instruction: Instruction) -> MintToCheckedParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.MINT_TO2)
+    accounts = instruction.accounts
+    _, amount, decimals = AMOUNT2_STRUCT.unpack_from(__validate_instruction(instruction, accounts, 3, _TAG_MINT_TO2))
     return MintToCheckedParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        decimals=parsed_data.args.decimals,
-        mint=instruction.accounts[0].pubkey,
-        dest=instruction.accounts[1].pubkey,
-        mint_authority=instruction.accounts[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.accounts[3:]],
+        amount=amount,
+        decimals=decimals,
+        mint=accounts[0].pubkey,
+        dest=accounts[1].pubkey,
+        mint_authority=accounts[2].pubkey,
+        signers=[signer.pubkey for signer in accounts[3:]],
     )
 
 
@@ -619,15 +708,16 @@ def decode_burn_checked(instruction: Instruction) -> BurnCheckedParams:
     Returns:
         The decoded instruction.
     """
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.BURN2)
+    accounts = instruction.accounts
+    _, amount, decimals = AMOUNT2_STRUCT.unpack_from(__validate_instruction(instruction, accounts, 3, _TAG_BURN2))
     return BurnCheckedParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        decimals=parsed_data.args.decimals,
-        account=instruction.accounts[0].pubkey,
-        mint=instruction.accounts[1].pubkey,
-        owner=instruction.accounts[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.accounts[3:]],
+        amount=amount,
+        decimals=decimals,
+        account=accounts[0].pubkey,
+        mint=accounts[1].pubkey,
+        owner=accounts[2].pubkey,
+        signers=[signer.pubkey for signer in accounts[3:]],
     )
 
 
@@ -646,55 +736,89 @@ def decode_sync_native(instruction: Instruction) -> SyncNativeParams:
     )
 
 
+_DECODERS: Dict[int, Callable[[Instruction], Any]] = {
+    InstructionType.INITIALIZE_MINT: decode_initialize_mint,
+    InstructionType.INITIALIZE_ACCOUNT: decode_initialize_account,
+    InstructionType.INITIALIZE_MULTISIG: decode_initialize_multisig,
+    InstructionType.TRANSFER: decode_transfer,
+    InstructionType.APPROVE: decode_approve,
+    InstructionType.REVOKE: decode_revoke,
+    InstructionType.SET_AUTHORITY: decode_set_authority,
+    InstructionType.MINT_TO: decode_mint_to,
+    InstructionType.BURN: decode_burn,
+    InstructionType.CLOSE_ACCOUNT: decode_close_account,
+    InstructionType.FREEZE_ACCOUNT: decode_freeze_account,
+    InstructionType.THAW_ACCOUNT: decode_thaw_account,
+    InstructionType.TRANSFER2: decode_transfer_checked,
+    InstructionType.APPROVE2: decode_approve_checked,
+    InstructionType.MINT_TO2: decode_mint_to_checked,
+    InstructionType.BURN2: decode_burn_checked,
+    InstructionType.SYNC_NATIVE: decode_sync_native,
+}
+"""Decoder for each token instruction type, keyed by the instruction's first data byte."""
+
+
+def decode_batch(instructions: Sequence[Instruction]) -> List[Any]:
+    """Decode a sequence of token instructions of any type and retrieve their instruction params.
+
+    Each instruction is dispatched on its instruction type to the matching ``decode_*`` function.
+
+    Args:
+        instructions: The instructions to decode.
+
+    Returns:
+        The decoded instructions, in the same order.
+
+    Raises:
+        ValueError: If an instruction is not a token instruction this module can decode.
+    """
+    decoders = _DECODERS
+    decoded = []
+    for instruction in instructions:
+        data = instruction.data
+        decoder = decoders.get(data[0]) if data else None
+        if decoder is None:
+            raise ValueError(f"invalid instruction; unsupported instruction type {data[0] if data else None}")
+        decoded.append(decoder(instruction))
+    return decoded
+
+
 def __add_signers(keys: List[AccountMeta], owner: Pubkey, signers: List[Pubkey]) -> None:
     if signers:
-        keys.append(AccountMeta(pubkey=owner, is_signer=False, is_writable=False))
-        for signer in signers:
-            keys.append(AccountMeta(pubkey=signer, is_signer=True, is_writable=False))
+        keys.append(AccountMeta(owner, False, False))
+        keys.extend([AccountMeta(signer, True, False) for signer in signers])
     else:
-        keys.append(AccountMeta(pubkey=owner, is_signer=True, is_writable=False))
+        keys.append(AccountMeta(owner, True, False))
 
 
 def __burn_instruction(params: Union[BurnParams, BurnCheckedParams], data: Any) -> Instruction:
     keys = [
-        AccountMeta(pubkey=params.account, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.mint, is_signer=False, is_writable=True),
+        AccountMeta(params.account, False, True),
+        AccountMeta(params.mint, False, True),
     ]
     __add_signers(keys, params.owner, params.signers)
 
-    return Instruction(accounts=keys, program_id=params.program_id, data=data)
+    return Instruction(params.program_id, data, keys)
 
 
-def __sync_native_instruction(params: SyncNativeParams, data: Any) -> Instruction:
+def __freeze_or_thaw_instruction(params: Union[FreezeAccountParams, ThawAccountParams], data: bytes) -> Instruction:
     keys = [
-        AccountMeta(pubkey=params.account, is_signer=False, is_writable=True),
-    ]
-
-    return Instruction(accounts=keys, program_id=params.program_id, data=data)
-
-
-def __freeze_or_thaw_instruction(
-    params: Union[FreezeAccountParams, ThawAccountParams],
-    instruction_type: InstructionType,
-) -> Instruction:
-    data = INSTRUCTIONS_LAYOUT.build({"instruction_type": instruction_type, "args": None})
-    keys = [
-        AccountMeta(pubkey=params.account, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.mint, is_signer=False, is_writable=False),
+        AccountMeta(params.account, False, True),
+        AccountMeta(params.mint, False, False),
     ]
     __add_signers(keys, params.authority, params.multi_signers)
 
-    return Instruction(accounts=keys, program_id=params.program_id, data=data)
+    return Instruction(params.program_id, data, keys)
 
 
 def __mint_to_instruction(params: Union[MintToParams, MintToCheckedParams], data: Any) -> Instruction:
     keys = [
-        AccountMeta(pubkey=params.mint, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.dest, is_signer=False, is_writable=True),
+        AccountMeta(params.mint, False, True),
+        AccountMeta(params.dest, False, True),
     ]
     __add_signers(keys, params.mint_authority, params.signers)
 
-    return Instruction(accounts=keys, program_id=params.program_id, data=data)
+    return Instruction(params.program_id, data, keys)
 
 
 def initialize_mint(params: InitializeMintParams) -> Instruction:
@@ -723,25 +847,20 @@ def initialize_mint(params: InitializeMintParams) -> Instruction:
     Returns:
         The instruction to initialize the mint.
     """
-    freeze_authority, opt = (params.freeze_authority, 1) if params.freeze_authority else (Pubkey([0] * 31 + [0]), 0)
-    data = INSTRUCTIONS_LAYOUT.build(
-        {
-            "instruction_type": InstructionType.INITIALIZE_MINT,
-            "args": {
-                "decimals": params.decimals,
-                "mint_authority": bytes(params.mint_authority),
-                "freeze_authority_option": opt,
-                "freeze_authority": bytes(freeze_authority),
-            },
-        }
+    if params.freeze_authority is not None:
+        freeze_authority, opt = bytes(params.freeze_authority), 1
+    else:
+        freeze_authority, opt = _ZERO_PUBKEY_BYTES, 0
+    data = INITIALIZE_MINT_STRUCT.pack(
+        _TAG_INITIALIZE_MINT, params.decimals, bytes(params.mint_authority), opt, freeze_authority
     )
     return Instruction(
-        accounts=[
-            AccountMeta(pubkey=params.mint, is_signer=False, is_writable=True),
-            AccountMeta(pubkey=RENT, is_signer=False, is_writable=False),
+        params.program_id,
+        data,
+        [
+            AccountMeta(params.mint, False, True),
+            _RENT_META,
         ],
-        program_id=params.program_id,
-        data=data,
     )
 
 
@@ -768,16 +887,15 @@ def initialize_account(params: InitializeAccountParams) -> Instruction:
     Returns:
         The instruction to initialize the account.
     """
-    data = INSTRUCTIONS_LAYOUT.build({"instruction_type": InstructionType.INITIALIZE_ACCOUNT, "args": None})
     return Instruction(
-        accounts=[
-            AccountMeta(pubkey=params.account, is_signer=False, is_writable=True),
-            AccountMeta(pubkey=params.mint, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=params.owner, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=RENT, is_signer=False, is_writable=False),
+        params.program_id,
+        _INITIALIZE_ACCOUNT_DATA,
+        [
+            AccountMeta(params.account, False, True),
+            AccountMeta(params.mint, False, False),
+            AccountMeta(params.owner, False, False),
+            _RENT_META,
         ],
-        program_id=params.program_id,
-        data=data,
     )
 
 
@@ -805,20 +923,14 @@ def initialize_multisig(params: InitializeMultisigParams) -> Instruction:
     Returns:
         The instruction to initialize the multisig.
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        {
-            "instruction_type": InstructionType.INITIALIZE_MULTISIG,
-            "args": {"m": params.m},
-        }
-    )
+    data = INITIALIZE_MULTISIG_STRUCT.pack(_TAG_INITIALIZE_MULTISIG, params.m)
     keys = [
-        AccountMeta(pubkey=params.multisig, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=RENT, is_signer=False, is_writable=False),
+        AccountMeta(params.multisig, False, True),
+        _RENT_META,
     ]
-    for signer in params.signers:
-        keys.append(AccountMeta(pubkey=signer, is_signer=False, is_writable=False))
+    keys.extend([AccountMeta(signer, False, False) for signer in params.signers])
 
-    return Instruction(accounts=keys, program_id=params.program_id, data=data)
+    return Instruction(params.program_id, data, keys)
 
 
 def transfer(params: TransferParams) -> Instruction:
@@ -843,19 +955,14 @@ def transfer(params: TransferParams) -> Instruction:
     Returns:
         The transfer instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        {
-            "instruction_type": InstructionType.TRANSFER,
-            "args": {"amount": params.amount},
-        }
-    )
+    data = AMOUNT_STRUCT.pack(_TAG_TRANSFER, params.amount)
     keys = [
-        AccountMeta(pubkey=params.source, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.dest, is_signer=False, is_writable=True),
+        AccountMeta(params.source, False, True),
+        AccountMeta(params.dest, False, True),
     ]
     __add_signers(keys, params.owner, params.signers)
 
-    return Instruction(accounts=keys, program_id=params.program_id, data=data)
+    return Instruction(params.program_id, data, keys)
 
 
 def approve(params: ApproveParams) -> Instruction:
@@ -878,14 +985,14 @@ def approve(params: ApproveParams) -> Instruction:
     Returns:
         The approve instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build({"instruction_type": InstructionType.APPROVE, "args": {"amount": params.amount}})
+    data = AMOUNT_STRUCT.pack(_TAG_APPROVE, params.amount)
     keys = [
-        AccountMeta(pubkey=params.source, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.delegate, is_signer=False, is_writable=False),
+        AccountMeta(params.source, False, True),
+        AccountMeta(params.delegate, False, False),
     ]
     __add_signers(keys, params.owner, params.signers)
 
-    return Instruction(accounts=keys, program_id=params.program_id, data=data)
+    return Instruction(params.program_id, data, keys)
 
 
 def revoke(params: RevokeParams) -> Instruction:
@@ -904,11 +1011,10 @@ def revoke(params: RevokeParams) -> Instruction:
     Returns:
         The revoke instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build({"instruction_type": InstructionType.REVOKE, "args": None})
-    keys = [AccountMeta(pubkey=params.account, is_signer=False, is_writable=True)]
+    keys = [AccountMeta(params.account, False, True)]
     __add_signers(keys, params.owner, params.signers)
 
-    return Instruction(accounts=keys, program_id=params.program_id, data=data)
+    return Instruction(params.program_id, _REVOKE_DATA, keys)
 
 
 def set_authority(params: SetAuthorityParams) -> Instruction:
@@ -931,21 +1037,15 @@ def set_authority(params: SetAuthorityParams) -> Instruction:
     Returns:
         The set authority instruction.
     """
-    new_authority, opt = (params.new_authority, 1) if params.new_authority else (Pubkey([0] * 31 + [0]), 0)
-    data = INSTRUCTIONS_LAYOUT.build(
-        {
-            "instruction_type": InstructionType.SET_AUTHORITY,
-            "args": {
-                "authority_type": params.authority,
-                "new_authority_option": opt,
-                "new_authority": bytes(new_authority),
-            },
-        }
-    )
-    keys = [AccountMeta(pubkey=params.account, is_signer=False, is_writable=True)]
+    if params.new_authority is not None:
+        new_authority, opt = bytes(params.new_authority), 1
+    else:
+        new_authority, opt = _ZERO_PUBKEY_BYTES, 0
+    data = SET_AUTHORITY_STRUCT.pack(_TAG_SET_AUTHORITY, params.authority, opt, new_authority)
+    keys = [AccountMeta(params.account, False, True)]
     __add_signers(keys, params.current_authority, params.signers)
 
-    return Instruction(accounts=keys, program_id=params.program_id, data=data)
+    return Instruction(params.program_id, data, keys)
 
 
 def mint_to(params: MintToParams) -> Instruction:
@@ -970,7 +1070,7 @@ def mint_to(params: MintToParams) -> Instruction:
     Returns:
         The mint-to instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build({"instruction_type": InstructionType.MINT_TO, "args": {"amount": params.amount}})
+    data = AMOUNT_STRUCT.pack(_TAG_MINT_TO, params.amount)
     return __mint_to_instruction(params, data)
 
 
@@ -990,7 +1090,7 @@ def burn(params: BurnParams) -> Instruction:
     Returns:
         The burn instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build({"instruction_type": InstructionType.BURN, "args": {"amount": params.amount}})
+    data = AMOUNT_STRUCT.pack(_TAG_BURN, params.amount)
     return __burn_instruction(params, data)
 
 
@@ -1011,14 +1111,13 @@ def close_account(params: CloseAccountParams) -> Instruction:
     Returns:
         The close-account instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build({"instruction_type": InstructionType.CLOSE_ACCOUNT, "args": None})
     keys = [
-        AccountMeta(pubkey=params.account, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.dest, is_signer=False, is_writable=True),
+        AccountMeta(params.account, False, True),
+        AccountMeta(params.dest, False, True),
     ]
     __add_signers(keys, params.owner, params.signers)
 
-    return Instruction(accounts=keys, program_id=params.program_id, data=data)
+    return Instruction(params.program_id, _CLOSE_ACCOUNT_DATA, keys)
 
 
 def freeze_account(params: FreezeAccountParams) -> Instruction:
@@ -1036,7 +1135,7 @@ def freeze_account(params: FreezeAccountParams) -> Instruction:
     Returns:
         The freeze-account instruction.
     """
-    return __freeze_or_thaw_instruction(params, InstructionType.FREEZE_ACCOUNT)
+    return __freeze_or_thaw_instruction(params, _FREEZE_ACCOUNT_DATA)
 
 
 def thaw_account(params: ThawAccountParams) -> Instruction:
@@ -1054,7 +1153,7 @@ def thaw_account(params: ThawAccountParams) -> Instruction:
     Returns:
         The thaw-account instruction.
     """
-    return __freeze_or_thaw_instruction(params, InstructionType.THAW_ACCOUNT)
+    return __freeze_or_thaw_instruction(params, _THAW_ACCOUNT_DATA)
 
 
 def transfer_checked(params: TransferCheckedParams) -> Instruction:
@@ -1079,20 +1178,15 @@ def transfer_checked(params: TransferCheckedParams) -> Instruction:
     Returns:
         The transfer-checked instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        {
-            "instruction_type": InstructionType.TRANSFER2,
-            "args": {"amount": params.amount, "decimals": params.decimals},
-        }
-    )
+    data = AMOUNT2_STRUCT.pack(_TAG_TRANSFER2, params.amount, params.decimals)
     keys = [
-        AccountMeta(pubkey=params.source, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.mint, is_signer=False, is_writable=False),
-        AccountMeta(pubkey=params.dest, is_signer=False, is_writable=True),
+        AccountMeta(params.source, False, True),
+        AccountMeta(params.mint, False, False),
+        AccountMeta(params.dest, False, True),
     ]
     __add_signers(keys, params.owner, params.signers)
 
-    return Instruction(accounts=keys, program_id=params.program_id, data=data)
+    return Instruction(params.program_id, data, keys)
 
 
 def approve_checked(params: ApproveCheckedParams) -> Instruction:
@@ -1117,20 +1211,15 @@ def approve_checked(params: ApproveCheckedParams) -> Instruction:
     Returns:
         The approve-checked instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        {
-            "instruction_type": InstructionType.APPROVE2,
-            "args": {"amount": params.amount, "decimals": params.decimals},
-        }
-    )
+    data = AMOUNT2_STRUCT.pack(_TAG_APPROVE2, params.amount, params.decimals)
     keys = [
-        AccountMeta(pubkey=params.source, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.mint, is_signer=False, is_writable=False),
-        AccountMeta(pubkey=params.delegate, is_signer=False, is_writable=False),
+        AccountMeta(params.source, False, True),
+        AccountMeta(params.mint, False, False),
+        AccountMeta(params.delegate, False, False),
     ]
     __add_signers(keys, params.owner, params.signers)
 
-    return Instruction(accounts=keys, program_id=params.program_id, data=data)
+    return Instruction(params.program_id, data, keys)
 
 
 def mint_to_checked(params: MintToCheckedParams) -> Instruction:
@@ -1154,12 +1243,7 @@ def mint_to_checked(params: MintToCheckedParams) -> Instruction:
     Returns:
         The mint-to-checked instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        {
-            "instruction_type": InstructionType.MINT_TO2,
-            "args": {"amount": params.amount, "decimals": params.decimals},
-        }
-    )
+    data = AMOUNT2_STRUCT.pack(_TAG_MINT_TO2, params.amount, params.decimals)
     return __mint_to_instruction(params, data)
 
 
@@ -1179,12 +1263,7 @@ def burn_checked(params: BurnCheckedParams) -> Instruction:
     Returns:
         The burn-checked instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        {
-            "instruction_type": InstructionType.BURN2,
-            "args": {"amount": params.amount, "decimals": params.decimals},
-        }
-    )
+    data = AMOUNT2_STRUCT.pack(_TAG_BURN2, params.amount, params.decimals)
     return __burn_instruction(params, data)
 
 
@@ -1202,13 +1281,7 @@ def sync_native(params: SyncNativeParams) -> Instruction:
     Returns:
         The sync-native instruction.
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        {
-            "instruction_type": InstructionType.SYNC_NATIVE,
-            "args": {},
-        }
-    )
-    return __sync_native_instruction(params, data)
+    return Instruction(params.program_id, _SYNC_NATIVE_DATA, [AccountMeta(params.account, False, True)])
 
 
 def get_associated_token_address(owner: Pubkey, mint: Pubkey, token_program_id: Pubkey = TOKEN_PROGRAM_ID) -> Pubkey:
@@ -1257,17 +1330,17 @@ def create_associated_token_account(
         raise ValueError("token_program_id must be one of TOKEN_PROGRAM_ID or TOKEN_2022_PROGRAM_ID.")
     associated_token_address = get_associated_token_address(owner, mint, token_program_id)
     return Instruction(
-        accounts=[
-            AccountMeta(pubkey=payer, is_signer=True, is_writable=True),
-            AccountMeta(pubkey=associated_token_address, is_signer=False, is_writable=True),
-            AccountMeta(pubkey=owner, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=token_program_id, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=RENT, is_signer=False, is_writable=False),
+        ASSOCIATED_TOKEN_PROGRAM_ID,
+        bytes(0),
+        [
+            AccountMeta(payer, True, True),
+            AccountMeta(associated_token_address, False, True),
+            AccountMeta(owner, False, False),
+            AccountMeta(mint, False, False),
+            _SYS_PROGRAM_META,
+            AccountMeta(token_program_id, False, False),
+            _RENT_META,
         ],
-        program_id=ASSOCIATED_TOKEN_PROGRAM_ID,
-        data=bytes(0),
     )
 
 
@@ -1279,14 +1352,14 @@ def create_idempotent_associated_token_account(payer: Pubkey, owner: Pubkey, min
     """
     associated_token_address = get_associated_token_address(owner, mint)
     return Instruction(
-        accounts=[
-            AccountMeta(pubkey=payer, is_signer=True, is_writable=True),
-            AccountMeta(pubkey=associated_token_address, is_signer=False, is_writable=True),
-            AccountMeta(pubkey=owner, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=TOKEN_PROGRAM_ID, is_signer=False, is_writable=False),
+        ASSOCIATED_TOKEN_PROGRAM_ID,
+        bytes([1]),
+        [
+            AccountMeta(payer, True, True),
+            AccountMeta(associated_token_address, False, True),
+            AccountMeta(owner, False, False),
+            AccountMeta(mint, False, False),
+            _SYS_PROGRAM_META,
+            _TOKEN_PROGRAM_META,
         ],
-        program_id=ASSOCIATED_TOKEN_PROGRAM_ID,
-        data=bytes([1]),
     )
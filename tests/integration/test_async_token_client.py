@@ -3,6 +3,7 @@
 
 import pytest
 import spl.token._layouts as layouts
+from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from spl.token.async_client import AsyncToken
 from spl.token.constants import ASSOCIATED_TOKEN_PROGRAM_ID, TOKEN_PROGRAM_ID
@@ -84,6 +85,39 @@ async def test_new_account(stubbed_sender, test_http_client_async, test_token):
     assert Pubkey(account_data.owner) == stubbed_sender.pubkey()
 
 
+@pytest.mark.integration
+async def test_create_accounts_bulk(stubbed_sender, test_token):  # pylint: disable=redefined-outer-name
+    """Test creating several token accounts concurrently."""
+    owners = [stubbed_sender.pubkey(), Keypair().pubkey()]
+    token_account_pks = await test_token.create_accounts_bulk(owners)
+    assert len(set(token_account_pks)) == len(owners)
+    for owner, token_account_pk in zip(owners, token_account_pks):
+        account_info = await test_token.get_account_info(token_account_pk)
+        assert account_info.is_initialized
+        assert account_info.mint == test_token.pubkey
+        assert account_info.owner == owner
+
+
+@pytest.mark.integration
+async def test_create_mint_and_account(stubbed_sender, test_http_client_async):
+    """Test creating a mint and a token account in one transaction."""
+    token, token_account_pk = await AsyncToken.create_mint_and_account(
+        test_http_client_async,
+        stubbed_sender,
+        stubbed_sender.pubkey(),
+        6,
+        TOKEN_PROGRAM_ID,
+        stubbed_sender.pubkey(),
+    )
+    account_info = await token.get_account_info(token_account_pk)
+    assert account_info.is_initialized
+    assert account_info.mint == token.pubkey
+    assert account_info.owner == stubbed_sender.pubkey()
+    mint_info = await token.get_mint_info()
+    assert mint_info.is_initialized
+    assert mint_info.decimals == 6
+
+
 @pytest.mark.integration
 async def test_new_associated_account(test_token):  # pylint: disable=redefined-outer-name
     """Test creating a new associated token account."""
@@ -123,6 +157,25 @@ async def test_get_mint_info(stubbed_sender, freeze_authority, test_token):  # p
     assert mint_info.freeze_authority == freeze_authority.pubkey()
 
 
+@pytest.mark.integration
+async def test_get_mint_and_accounts(stubbed_sender, stubbed_sender_token_account_pk, test_token):  # pylint: disable=redefined-outer-name
+    """Test get token mint info together with account info."""
+    mint_info, account_infos = await test_token.get_mint_and_accounts([stubbed_sender_token_account_pk])
+    assert mint_info == await test_token.get_mint_info()
+    assert len(account_infos) == 1
+    assert account_infos[0] == await test_token.get_account_info(stubbed_sender_token_account_pk)
+    assert account_infos[0].owner == stubbed_sender.pubkey()
+    assert await test_token.get_mint_and_account_info(stubbed_sender_token_account_pk) == (mint_info, account_infos[0])
+
+
+@pytest.mark.integration
+async def test_get_account_infos(stubbed_sender_token_account_pk, test_token):  # pylint: disable=redefined-outer-name
+    """Test get the info of several token accounts at once."""
+    missing = Pubkey.new_unique()
+    account_infos = await test_token.get_account_infos([stubbed_sender_token_account_pk, missing])
+    assert account_infos == [await test_token.get_account_info(stubbed_sender_token_account_pk), None]
+
+
 @pytest.mark.integration
 async def test_mint_to(stubbed_sender, stubbed_sender_token_account_pk, test_token):  # pylint: disable=redefined-outer-name
     """Test mint token to account and get balance."""
@@ -162,6 +215,15 @@ async def test_transfer(
     assert balance_info.ui_amount == 0.0005
 
 
+@pytest.mark.integration
+async def test_get_balances(async_stubbed_receiver_token_account_pk, stubbed_sender_token_account_pk, test_token):  # pylint: disable=redefined-outer-name
+    """Test getting the balances of several token accounts at once."""
+    resps = await test_token.get_balances([stubbed_sender_token_account_pk, async_stubbed_receiver_token_account_pk])
+    for resp in resps:
+        assert_valid_response(resp)
+    assert [resp.value.amount for resp in resps] == ["500", "500"]
+
+
 @pytest.mark.integration
 async def test_burn(stubbed_sender, stubbed_sender_token_account_pk, test_token):  # pylint: disable=redefined-outer-name
     """Test burning tokens."""
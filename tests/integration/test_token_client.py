@@ -81,6 +81,26 @@ def test_new_account(stubbed_sender, test_http_client, test_token):  # pylint: d
     assert Pubkey(account_data.owner) == stubbed_sender.pubkey()
 
 
+@pytest.mark.integration
+def test_create_mint_and_account(stubbed_sender, test_http_client):
+    """Test creating a mint and a token account in one transaction."""
+    token, token_account_pk = Token.create_mint_and_account(
+        test_http_client,
+        stubbed_sender,
+        stubbed_sender.pubkey(),
+        6,
+        TOKEN_PROGRAM_ID,
+        stubbed_sender.pubkey(),
+    )
+    account_info = token.get_account_info(token_account_pk)
+    assert account_info.is_initialized
+    assert account_info.mint == token.pubkey
+    assert account_info.owner == stubbed_sender.pubkey()
+    mint_info = token.get_mint_info()
+    assert mint_info.is_initialized
+    assert mint_info.decimals == 6
+
+
 @pytest.mark.integration
 def test_new_associated_account(test_token):  # pylint: disable=redefined-outer-name
     """Test creating a new associated token account."""
@@ -120,6 +140,25 @@ def test_get_mint_info(stubbed_sender, freeze_authority, test_token):  # pylint:
     assert mint_info.freeze_authority == freeze_authority.pubkey()
 
 
+@pytest.mark.integration
+def test_get_mint_and_accounts(stubbed_sender, stubbed_sender_token_account_pk, test_token):  # pylint: disable=redefined-outer-name
+    """Test get token mint info together with account info."""
+    mint_info, account_infos = test_token.get_mint_and_accounts([stubbed_sender_token_account_pk])
+    assert mint_info == test_token.get_mint_info()
+    assert len(account_infos) == 1
+    assert account_infos[0] == test_token.get_account_info(stubbed_sender_token_account_pk)
+    assert account_infos[0].owner == stubbed_sender.pubkey()
+    assert test_token.get_mint_and_account_info(stubbed_sender_token_account_pk) == (mint_info, account_infos[0])
+
+
+@pytest.mark.integration
+def test_get_account_infos(stubbed_sender_token_account_pk, test_token):  # pylint: disable=redefined-outer-name
+    """Test get the info of several token accounts at once."""
+    missing = Pubkey.new_unique()
+    account_infos = test_token.get_account_infos([stubbed_sender_token_account_pk, missing])
+    assert account_infos == [test_token.get_account_info(stubbed_sender_token_account_pk), None]
+
+
 @pytest.mark.integration
 def test_mint_to(stubbed_sender, stubbed_sender_token_account_pk, test_token):  # pylint: disable=redefined-outer-name
     """Test mint token to account and get balance."""
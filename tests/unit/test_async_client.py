@@ -12,6 +12,7 @@ from solders.signature import Signature
 
 from solana.constants import SYSTEM_PROGRAM_ID
 from solana.exceptions import SolanaRpcException
+from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Finalized
 
 
@@ -48,3 +49,11 @@ def test_client_address_sig_args_with_commitment(unit_test_http_client_async):
         Pubkey([0] * 31 + [0]), None, None, 5, Finalized
     )
     assert expected == actual
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_async_client_http2_flag(http2):
+    """Test the http2 flag is passed to the underlying httpx async client."""
+    with patch("httpx.AsyncClient") as client_mock:
+        AsyncClient("http://localhost:8899", http2=http2)
+    assert client_mock.call_args.kwargs["http2"] is http2
@@ -7,11 +7,12 @@ from httpx import ReadTimeout
 from solders.commitment_config import CommitmentLevel
 from solders.pubkey import Pubkey
 from solders.rpc.config import RpcSignaturesForAddressConfig
-from solders.rpc.requests import GetSignaturesForAddress
+from solders.rpc.requests import GetEpochInfo, GetSignaturesForAddress
 from solders.signature import Signature
 
 from solana.constants import SYSTEM_PROGRAM_ID
 from solana.exceptions import SolanaRpcException
+from solana.rpc.api import Client
 from solana.rpc.commitment import Finalized
 
 
@@ -46,3 +47,26 @@ def test_client_address_sig_args_with_commitment(unit_test_http_client):
     )
     actual = unit_test_http_client._get_signatures_for_address_body(Pubkey([0] * 31 + [0]), None, None, 5, Finalized)
     assert expected == actual
+
+
+def test_client_request_kwargs_extra_headers():
+    """Test extra headers are sent with every request."""
+    client = Client("http://localhost:8899", extra_headers={"Authorization": "Bearer token"})
+    kwargs = client._provider._build_request_kwargs(GetEpochInfo())
+    assert kwargs["headers"] == {"Content-Type": "application/json", "Authorization": "Bearer token"}
+    assert kwargs["content"] == GetEpochInfo().to_json()
+    batch_kwargs = client._provider._build_batch_request_kwargs((GetEpochInfo(),))
+    assert batch_kwargs["headers"] == kwargs["headers"]
+
+    client._provider.extra_headers = {"Authorization": "Bearer refreshed"}
+    refreshed = client._provider._build_request_kwargs(GetEpochInfo())
+    assert refreshed["headers"] == {"Content-Type": "application/json", "Authorization": "Bearer refreshed"}
+    assert refreshed["headers"] is not kwargs["headers"]
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_client_http2_flag(http2):
+    """Test the http2 flag is passed to the underlying httpx client."""
+    with patch("httpx.Client") as client_mock:
+        Client("http://localhost:8899", http2=http2)
+    assert client_mock.call_args.kwargs["http2"] is http2
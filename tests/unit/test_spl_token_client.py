@@ -0,0 +1,592 @@
+"""Unit tests for the SPL Token clients."""
+
+import asyncio
+import gc
+import json
+import weakref
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from solders.account import Account
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.rpc.errors import InvalidParamsMessage, ParseErrorMessage
+from solders.rpc.requests import GetTokenAccountsByDelegate, GetTokenAccountsByOwner
+from solders.rpc.responses import (
+    GetAccountInfoResp,
+    GetMinimumBalanceForRentExemptionResp,
+    GetMultipleAccountsResp,
+    GetTokenAccountBalanceResp,
+    GetTokenAccountsByDelegateJsonParsedResp,
+    GetTokenAccountsByOwnerResp,
+    RpcResponseContext,
+)
+from solders.system_program import ID as SYS_PROGRAM_ID
+
+from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.types import TxOpts
+from spl.token._layouts import ACCOUNT_LAYOUT, MINT_LAYOUT
+from spl.token.async_client import AsyncToken
+from spl.token.client import Token
+from spl.token.constants import ACCOUNT_LEN, MINT_LEN, TOKEN_PROGRAM_ID
+from spl.token.core import _parse_batch, clear_rent_exempt_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_rent_exempt_cache():
+    """Start and end every test without cached rent-exemption minimums."""
+    clear_rent_exempt_cache()
+    yield
+    clear_rent_exempt_cache()
+
+
+def test_min_balance_rent_for_exempt_is_cached():
+    """Test the rent-exemption minimum is fetched once per endpoint and size, until the cache is cleared."""
+    conn = MagicMock()
+    conn._provider.endpoint_uri = "http://localhost:8899"
+    conn.get_minimum_balance_for_rent_exemption.return_value = GetMinimumBalanceForRentExemptionResp(2039280)
+
+    assert Token.get_min_balance_rent_for_exempt_for_account(conn) == 2039280
+    assert Token.get_min_balance_rent_for_exempt_for_account(conn) == 2039280
+    conn.get_minimum_balance_for_rent_exemption.assert_called_once_with(ACCOUNT_LEN)
+
+    Token.get_min_balance_rent_for_exempt_for_mint(conn)
+    conn.get_minimum_balance_for_rent_exemption.assert_called_with(MINT_LEN)
+    assert conn.get_minimum_balance_for_rent_exemption.call_count == 2
+
+    clear_rent_exempt_cache()
+    Token.get_min_balance_rent_for_exempt_for_account(conn)
+    assert conn.get_minimum_balance_for_rent_exemption.call_count == 3
+
+
+def test_rent_exempt_cache_is_bounded():
+    """Test the rent-exemption cache evicts the oldest entries once it is full."""
+    conn = MagicMock()
+    conn.get_minimum_balance_for_rent_exemption.return_value = GetMinimumBalanceForRentExemptionResp(2039280)
+    for port in range(65):
+        conn._provider.endpoint_uri = f"http://localhost:{port}"
+        Token.get_min_balance_rent_for_exempt_for_account(conn)
+
+    conn._provider.endpoint_uri = "http://localhost:64"
+    Token.get_min_balance_rent_for_exempt_for_account(conn)
+    assert conn.get_minimum_balance_for_rent_exemption.call_count == 65
+    conn._provider.endpoint_uri = "http://localhost:0"
+    Token.get_min_balance_rent_for_exempt_for_account(conn)
+    assert conn.get_minimum_balance_for_rent_exemption.call_count == 66
+
+
+def test_create_account_uses_supplied_rent_exempt_balance():
+    """Test a caller-supplied rent-exemption minimum skips the rent RPC."""
+    conn = MagicMock()
+    conn._provider.endpoint_uri = "http://localhost:8899"
+    token = Token(conn, Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair())
+
+    token.create_account(Pubkey.new_unique(), recent_blockhash=Hash.default(), rent_exempt_balance=2039280)
+
+    conn.get_minimum_balance_for_rent_exemption.assert_not_called()
+    txn = conn.send_transaction.call_args.args[0]
+    assert txn.message.instructions[0].data[4:12] == (2039280).to_bytes(8, "little")
+
+
+def test_create_mint_and_account_uses_supplied_rent_exempt_balances():
+    """Test caller-supplied rent-exemption minimums skip both rent RPCs."""
+    conn = MagicMock()
+    conn._provider.endpoint_uri = "http://localhost:8899"
+
+    Token.create_mint_and_account(
+        conn,
+        Keypair(),
+        Pubkey.new_unique(),
+        6,
+        TOKEN_PROGRAM_ID,
+        Pubkey.new_unique(),
+        recent_blockhash=Hash.default(),
+        mint_rent_exempt_balance=1461600,
+        account_rent_exempt_balance=2039280,
+    )
+
+    conn.get_minimum_balance_for_rent_exemption.assert_not_called()
+    message = conn.send_transaction.call_args.args[0].message
+    lamports = [
+        int.from_bytes(ix.data[4:12], "little")
+        for ix in message.instructions
+        if message.account_keys[ix.program_id_index] == SYS_PROGRAM_ID
+    ]
+    assert lamports == [1461600, 2039280]
+
+
+def test_get_accounts_multi_sends_one_batch():
+    """Test accounts queries go out as one batch and come back in request order."""
+    owner, delegate = Pubkey.new_unique(), Pubkey.new_unique()
+    conn = Client("http://accounts-multi.test")
+    conn._provider = MagicMock()
+    conn._provider.make_batch_request_unparsed.return_value = json.dumps(
+        [
+            {"jsonrpc": "2.0", "id": 1, "result": {"context": {"slot": 2}, "value": []}},
+            {"jsonrpc": "2.0", "id": 0, "result": {"context": {"slot": 1}, "value": []}},
+        ]
+    )
+    token = Token(conn, Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair())
+
+    resps = token.get_accounts_multi([("owner", owner, None, "base64"), ("delegate", delegate, None, "jsonParsed")])
+
+    (reqs,) = conn._provider.make_batch_request_unparsed.call_args.args
+    assert [type(req) for req in reqs] == [GetTokenAccountsByOwner, GetTokenAccountsByDelegate]
+    assert [req.id for req in reqs] == [0, 1]
+    assert isinstance(resps[0], GetTokenAccountsByOwnerResp) and resps[0].context.slot == 1
+    assert isinstance(resps[1], GetTokenAccountsByDelegateJsonParsedResp) and resps[1].context.slot == 2
+
+
+def test_parse_batch_matches_responses_by_id():
+    """Test batch responses are matched to their parsers by id without decoding the document in Python."""
+    raw = json.dumps(
+        [
+            {"id": 1, "jsonrpc": "2.0", "result": {"context": {"slot": 2}, "value": []}},
+            {"jsonrpc": "2.0", "error": {"code": -32602, "message": "bad params"}, "id": 0},
+        ]
+    )
+    with patch("json.loads", side_effect=AssertionError("batch decoded with json.loads")):
+        resps = _parse_batch(raw, [GetTokenAccountBalanceResp, GetTokenAccountsByOwnerResp])
+    assert isinstance(resps[0], InvalidParamsMessage) and resps[0].message == "bad params"
+    assert isinstance(resps[1], GetTokenAccountsByOwnerResp) and resps[1].context.slot == 2
+
+    # A response without a usable id leaves nothing to match on, so the responses are taken in order.
+    raw = json.dumps(
+        [
+            {"jsonrpc": "2.0", "error": {"code": -32700, "message": "Parse error"}, "id": None},
+            {"jsonrpc": "2.0", "result": {"context": {"slot": 1}, "value": []}, "id": 1},
+        ]
+    )
+    resps = _parse_batch(raw, [GetTokenAccountBalanceResp, GetTokenAccountsByOwnerResp])
+    assert isinstance(resps[0], ParseErrorMessage)
+    assert isinstance(resps[1], GetTokenAccountsByOwnerResp)
+
+
+def test_blockhash_cache():
+    """Test a fetched blockhash is only reused when blockhash caching is enabled."""
+    for ttl, expected_fetches in ((0.0, 2), (60.0, 1)):
+        conn = MagicMock()
+        conn.get_latest_blockhash.return_value.value.blockhash = Hash.new_unique()
+        owner = Keypair()
+        token = Token(conn, Pubkey.new_unique(), TOKEN_PROGRAM_ID, owner, blockhash_cache_ttl=ttl)
+
+        token.revoke(Pubkey.new_unique(), owner)
+        token.revoke(Pubkey.new_unique(), owner)
+
+        assert conn.get_latest_blockhash.call_count == expected_fetches
+
+
+def test_get_balances_multi_sends_one_batch():
+    """Test balance lookups go out as one batch with one id per account."""
+    pubkeys = [Pubkey.new_unique() for _ in range(3)]
+    conn = Client("http://balances-multi.test")
+    conn._provider = MagicMock()
+    conn._provider.make_batch_request_unparsed.return_value = json.dumps(
+        [
+            {
+                "jsonrpc": "2.0",
+                "id": req_id,
+                "result": {
+                    "context": {"slot": 1},
+                    "value": {"amount": str(req_id), "decimals": 0, "uiAmount": req_id, "uiAmountString": str(req_id)},
+                },
+            }
+            for req_id in (2, 0, 1)
+        ]
+    )
+    token = Token(conn, Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair())
+
+    resps = token.get_balances_multi(pubkeys)
+
+    (reqs,) = conn._provider.make_batch_request_unparsed.call_args.args
+    assert [(req.account, req.id) for req in reqs] == [(pubkey, req_id) for req_id, pubkey in enumerate(pubkeys)]
+    assert [resp.value.amount for resp in resps] == ["0", "1", "2"]
+
+
+async def test_async_get_balances_multi_matches_responses_by_id():
+    """Test batched balances come back in account order, with an error object for a failed lookup."""
+    pubkeys = [Pubkey.new_unique() for _ in range(3)]
+    conn = AsyncClient("http://balances-multi.test")
+    conn._provider = AsyncMock()
+    conn._provider.make_batch_request_unparsed.return_value = json.dumps(
+        [
+            {"jsonrpc": "2.0", "id": 2, "error": {"code": -32602, "message": "Invalid param: not a Token account"}},
+            {
+                "jsonrpc": "2.0",
+                "id": 0,
+                "result": {
+                    "context": {"slot": 1},
+                    "value": {"amount": "5", "decimals": 0, "uiAmount": 5, "uiAmountString": "5"},
+                },
+            },
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "result": {
+                    "context": {"slot": 1},
+                    "value": {"amount": "7", "decimals": 0, "uiAmount": 7, "uiAmountString": "7"},
+                },
+            },
+        ]
+    )
+    token = AsyncToken(conn, Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair())
+
+    with patch("json.loads", side_effect=AssertionError("batch decoded with json.loads")):
+        resps = await token.get_balances_multi(pubkeys)
+
+    assert [resp.value.amount for resp in resps[:2]] == ["5", "7"]
+    assert isinstance(resps[2], InvalidParamsMessage)
+
+
+def test_transfer_skip_preflight():
+    """Test skip_preflight overrides the preflight setting of the transaction options."""
+    conn = MagicMock()
+    owner = Keypair()
+    token = Token(conn, Pubkey.new_unique(), TOKEN_PROGRAM_ID, owner)
+
+    token.transfer(Pubkey.new_unique(), Pubkey.new_unique(), owner, 1, recent_blockhash=Hash.default())
+    assert not conn.send_transaction.call_args.kwargs["opts"].skip_preflight
+
+    token.transfer(
+        Pubkey.new_unique(), Pubkey.new_unique(), owner, 1, recent_blockhash=Hash.default(), skip_preflight=True
+    )
+    assert conn.send_transaction.call_args.kwargs["opts"].skip_preflight
+
+
+def test_transfer_many_packs_transactions():
+    """Test transfers are packed into as few transactions as fit the size limit, in order."""
+    conn = MagicMock()
+    owner = Keypair()
+    token = Token(conn, Pubkey.new_unique(), TOKEN_PROGRAM_ID, owner)
+    transfers = [(Pubkey.new_unique(), Pubkey.new_unique(), amount) for amount in range(1, 41)]
+
+    token.transfer_many(transfers, owner, recent_blockhash=Hash.default())
+
+    txns = [call.args[0] for call in conn.send_transaction.call_args_list]
+    assert [len(txn.message.instructions) for txn in txns] == [13, 13, 13, 1]
+    assert all(len(bytes(txn)) <= 1232 for txn in txns)
+    amounts = [int.from_bytes(ix.data[1:9], "little") for txn in txns for ix in txn.message.instructions]
+    assert amounts == list(range(1, 41))
+
+    # Transfers from one source share its account key, so more of them fit in a transaction.
+    conn.reset_mock()
+    source = Pubkey.new_unique()
+    token.transfer_many(
+        [(source, dest, amount) for _, dest, amount in transfers], owner, recent_blockhash=Hash.default()
+    )
+    txns = [call.args[0] for call in conn.send_transaction.call_args_list]
+    assert [len(txn.message.instructions) for txn in txns] == [22, 18]
+
+
+def test_transfer_many_rolls_over_when_a_transfer_does_not_fit():
+    """Test a transfer that does not fit in the current transaction starts the next one."""
+    conn = MagicMock()
+    token = Token(conn, Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair())
+    transfers = [(Pubkey.new_unique(), Pubkey.new_unique(), amount) for amount in range(1, 5)]
+
+    # With nine multisig signers a single transfer takes up most of a transaction.
+    token.transfer_many(transfers, Pubkey.new_unique(), [Keypair() for _ in range(9)], recent_blockhash=Hash.default())
+
+    txns = [call.args[0] for call in conn.send_transaction.call_args_list]
+    assert [len(txn.message.instructions) for txn in txns] == [1, 1, 1, 1]
+    assert all(len(txn.signatures) == 10 and len(bytes(txn)) <= 1232 for txn in txns)
+
+
+def test_account_info_decodes_close_authority():
+    """Test the close authority is read from its own field, not the owner's."""
+    mint, owner, close_authority = Pubkey.new_unique(), Pubkey.new_unique(), Pubkey.new_unique()
+    data = ACCOUNT_LAYOUT.build(
+        {
+            "mint": bytes(mint),
+            "owner": bytes(owner),
+            "amount": 5,
+            "delegate_option": 0,
+            "delegate": bytes(32),
+            "state": 1,
+            "is_native_option": 0,
+            "is_native": 0,
+            "delegated_amount": 0,
+            "close_authority_option": 1,
+            "close_authority": bytes(close_authority),
+        }
+    )
+    token = Token(MagicMock(), mint, TOKEN_PROGRAM_ID, Keypair())
+
+    info = token._decode_account_info(Account(2039280, data, TOKEN_PROGRAM_ID, False, 0))
+
+    assert (info.mint, info.owner, info.close_authority) == (mint, owner, close_authority)
+    assert (info.is_initialized, info.is_frozen) == (True, False)
+    other = Token(MagicMock(), Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair())
+    with pytest.raises(AttributeError, match="Invalid account mint"):
+        other._decode_account_info(Account(2039280, data, TOKEN_PROGRAM_ID, False, 0))
+
+
+def test_mint_info_decodes_optional_authorities():
+    """Test mint fields are decoded from the packed mint layout."""
+    freeze_authority = Pubkey.new_unique()
+    data = MINT_LAYOUT.build(
+        {
+            "mint_authority_option": 0,
+            "mint_authority": bytes(32),
+            "supply": 10**9,
+            "decimals": 6,
+            "is_initialized": 1,
+            "freeze_authority_option": 1,
+            "freeze_authority": bytes(freeze_authority),
+        }
+    )
+    token = Token(MagicMock(), Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair())
+
+    info = token._decode_mint_info(Account(1461600, data, TOKEN_PROGRAM_ID, False, 0))
+
+    assert info == (None, 10**9, 6, True, freeze_authority)
+
+
+def test_keypair_authority_signs_as_the_owner_account():
+    """Test a single keypair authority is not repeated as a multisig signer account."""
+    conn = MagicMock()
+    owner = Keypair()
+    token = Token(conn, Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair())
+
+    token.transfer(Pubkey.new_unique(), Pubkey.new_unique(), owner, 1, recent_blockhash=Hash.default())
+
+    txn = conn.send_transaction.call_args.args[0]
+    (ix,) = txn.message.instructions
+    assert len(ix.accounts) == 3
+    assert txn.message.account_keys[ix.accounts[2]] == owner.pubkey()
+    assert txn.message.is_signer(ix.accounts[2])
+    assert len(txn.signatures) == 2
+
+
+def test_freeze_and_thaw_merge_an_authority_equal_to_the_payer():
+    """Test an authority keypair equal to the fee payer is passed as a signer once, after the payer."""
+    payer = Keypair()
+    token = Token(MagicMock(), Pubkey.new_unique(), TOKEN_PROGRAM_ID, payer)
+    authority = Keypair.from_bytes(bytes(payer))
+
+    with patch("spl.token.core._build_tx") as build_tx:
+        token._freeze_account_args(Pubkey.new_unique(), authority, None, TxOpts(), Hash.default())
+        token._thaw_account_args(Pubkey.new_unique(), authority, None, TxOpts(), Hash.default())
+
+    for call in build_tx.call_args_list:
+        (signers,) = call.args[1]
+        assert signers is payer
+
+
+def _async_token(conn: AsyncMock, **kwargs) -> AsyncToken:
+    conn.commitment = None
+    return AsyncToken(conn, Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair(), **kwargs)
+
+
+@pytest.mark.parametrize("skip_preflight_default", [False, True])
+async def test_async_token_skip_preflight_default(skip_preflight_default):
+    """Test skip_preflight_default reaches create_* transactions and transactions sent without opts."""
+    conn = AsyncMock()
+    token = _async_token(conn, skip_preflight_default=skip_preflight_default)
+
+    await token.create_account(Pubkey.new_unique(), recent_blockhash=Hash.default(), rent_exempt_balance=2039280)
+    assert conn.send_transaction.call_args.kwargs["opts"].skip_preflight is skip_preflight_default
+
+    await token.revoke(Pubkey.new_unique(), token.payer, recent_blockhash=Hash.default())
+    assert conn.send_transaction.call_args.kwargs["opts"].skip_preflight is skip_preflight_default
+
+
+@pytest.mark.parametrize("max_inflight", [0, -1])
+def test_async_token_rejects_max_inflight_below_one(max_inflight):
+    """Test an unusable request cap is rejected up front."""
+    with pytest.raises(ValueError, match="max_inflight must be at least 1"):
+        _async_token(AsyncMock(), max_inflight=max_inflight)
+    token = _async_token(AsyncMock())
+    with pytest.raises(ValueError, match="max_inflight must be at least 1"):
+        token.set_max_inflight(max_inflight)
+
+
+async def test_async_token_caps_inflight_requests():
+    """Test at most max_inflight RPCs run at once, and that set_max_inflight applies to new requests."""
+    conn = AsyncMock()
+    running, peaks = 0, []
+
+    async def track(*_):
+        nonlocal running
+        running += 1
+        peaks.append(running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return GetMinimumBalanceForRentExemptionResp(3486960)
+
+    conn.get_token_account_balance.side_effect = track
+    token = _async_token(conn, max_inflight=2)
+
+    await asyncio.gather(*(token.get_balance(Pubkey.new_unique()) for _ in range(6)))
+    assert max(peaks) == 2
+
+    for max_inflight in (4, 1):
+        peaks.clear()
+        token.set_max_inflight(max_inflight)
+        await asyncio.gather(*(token.get_balance(Pubkey.new_unique()) for _ in range(8)))
+        assert max(peaks) == max_inflight
+
+    # Rent lookups made on behalf of the client share its limit.
+    peaks.clear()
+    token.set_max_inflight(2)
+    conn.get_minimum_balance_for_rent_exemption.side_effect = track
+    conn._provider.endpoint_uri = "http://localhost:8899"
+    await asyncio.gather(
+        *(token.get_balance(Pubkey.new_unique()) for _ in range(3)),
+        token.create_multisig(1, [Pubkey.new_unique()], recent_blockhash=Hash.default()),
+    )
+    assert max(peaks) == 2
+    conn.get_minimum_balance_for_rent_exemption.assert_awaited_once()
+
+
+def _account_info_resp(mint: Pubkey) -> GetAccountInfoResp:
+    data = ACCOUNT_LAYOUT.build(
+        {
+            "mint": bytes(mint),
+            "owner": bytes(Pubkey.new_unique()),
+            "amount": 5,
+            "delegate_option": 0,
+            "delegate": bytes(32),
+            "state": 1,
+            "is_native_option": 0,
+            "is_native": 0,
+            "delegated_amount": 0,
+            "close_authority_option": 0,
+            "close_authority": bytes(32),
+        }
+    )
+    return GetAccountInfoResp(Account(2039280, data, TOKEN_PROGRAM_ID, False, 0), RpcResponseContext(1))
+
+
+async def test_async_token_coalesces_concurrent_account_info_requests():
+    """Test concurrent lookups of one account share a request, and one caller's cancellation spares the rest."""
+    conn = AsyncMock()
+    token = _async_token(conn)
+    released = asyncio.Event()
+
+    async def get_account_info(*_):
+        await released.wait()
+        return _account_info_resp(token.pubkey)
+
+    conn.get_account_info.side_effect = get_account_info
+    pubkey = Pubkey.new_unique()
+
+    first = asyncio.ensure_future(token.get_account_info(pubkey))
+    second = asyncio.ensure_future(token.get_account_info(pubkey))
+    await asyncio.sleep(0)
+    first.cancel()
+    released.set()
+
+    info = await second
+    assert info.mint == token.pubkey and info.amount == 5
+    assert first.cancelled()
+    conn.get_account_info.assert_called_once()
+
+
+async def test_async_token_coalesced_error_is_retrieved_when_every_caller_is_cancelled():
+    """Test a failed shared request is not reported as an unretrieved task exception."""
+    conn = AsyncMock()
+    token = _async_token(conn)
+    released = asyncio.Event()
+
+    async def get_account_info(*_):
+        await released.wait()
+        raise RuntimeError("rpc failed")
+
+    conn.get_account_info.side_effect = get_account_info
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    previous_handler = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+    try:
+        caller = asyncio.ensure_future(token.get_account_info(Pubkey.new_unique()))
+        await asyncio.sleep(0)
+        caller.cancel()
+        released.set()
+        while token._pending_account_infos:
+            await asyncio.sleep(0)
+        # The cancelled caller's traceback holds the shared request; the report happens when both are collected.
+        del caller
+        gc.collect()
+    finally:
+        loop.set_exception_handler(previous_handler)
+    assert unhandled == []
+
+
+async def test_async_transfer_many_sends_transactions_in_order():
+    """Test packed transactions are sent one at a time, in transfer order."""
+    conn = AsyncMock()
+    running, peaks = 0, []
+
+    async def send_transaction(txn, opts):
+        nonlocal running
+        running += 1
+        peaks.append(running)
+        await asyncio.sleep(0)
+        running -= 1
+        return txn
+
+    conn.send_transaction.side_effect = send_transaction
+    owner = Keypair()
+    token = _async_token(conn)
+    transfers = [(Pubkey.new_unique(), Pubkey.new_unique(), amount) for amount in range(1, 41)]
+
+    txns = await token.transfer_many(transfers, owner, recent_blockhash=Hash.default())
+
+    assert len(txns) > 1 and max(peaks) == 1
+    amounts = [int.from_bytes(ix.data[1:9], "little") for txn in txns for ix in txn.message.instructions]
+    assert amounts == list(range(1, 41))
+
+
+def test_transfer_many_rejects_a_transfer_too_large_for_one_transaction():
+    """Test a transfer that cannot fit in a transaction on its own raises instead of being sent oversized."""
+    conn = MagicMock()
+    token = Token(conn, Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair())
+    multisig = Pubkey.new_unique()
+    transfers = [(Pubkey.new_unique(), Pubkey.new_unique(), 1)]
+
+    with pytest.raises(ValueError, match="over the 1232-byte limit"):
+        token.transfer_many(transfers, multisig, [Keypair() for _ in range(11)], recent_blockhash=Hash.default())
+    conn.send_transaction.assert_not_called()
+
+
+def test_token_clients_support_weak_references():
+    """Test slotted token clients can still be weakly referenced."""
+    token = Token(MagicMock(), Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair())
+    assert weakref.ref(token)() is token
+    async_token = _async_token(AsyncMock())
+    assert weakref.ref(async_token)() is async_token
+
+
+def test_get_mint_and_accounts_limits_and_missing_accounts():
+    """Test the account limit is checked before any RPC, and missing accounts come back as None."""
+    conn = MagicMock()
+    token = Token(conn, Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair())
+    with pytest.raises(ValueError, match="At most 99 accounts"):
+        token.get_mint_and_accounts([Pubkey.new_unique() for _ in range(100)])
+    conn.get_multiple_accounts.assert_not_called()
+
+    mint_data = MINT_LAYOUT.build(
+        {
+            "mint_authority_option": 0,
+            "mint_authority": bytes(32),
+            "supply": 7,
+            "decimals": 6,
+            "is_initialized": 1,
+            "freeze_authority_option": 0,
+            "freeze_authority": bytes(32),
+        }
+    )
+    mint_account = Account(1461600, mint_data, TOKEN_PROGRAM_ID, False, 0)
+    conn.get_multiple_accounts.return_value = GetMultipleAccountsResp([mint_account, None], RpcResponseContext(1))
+    missing = Pubkey.new_unique()
+
+    mint_info, account_infos = token.get_mint_and_accounts([missing])
+
+    assert mint_info.supply == 7
+    assert account_infos == [None]
+    assert conn.get_multiple_accounts.call_args.args[0] == [token.pubkey, missing]
+    with pytest.raises(ValueError, match="Failed to find account"):
+        token.get_mint_and_account_info(missing)
@@ -0,0 +1,20 @@
+"""Unit tests for the SPL Token constants."""
+
+import pytest
+from solders.pubkey import Pubkey
+
+from spl.token import constants
+
+
+@pytest.mark.parametrize(
+    "name, base58",
+    [
+        ("ASSOCIATED_TOKEN_PROGRAM_ID", "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"),
+        ("TOKEN_PROGRAM_ID", "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"),
+        ("TOKEN_2022_PROGRAM_ID", "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"),
+        ("WRAPPED_SOL_MINT", "So11111111111111111111111111111111111111112"),
+    ],
+)
+def test_pubkey_constants_match_base58(name, base58):
+    """Test the byte-literal public keys decode to their well-known base58 addresses."""
+    assert bytes(getattr(constants, name)) == bytes(Pubkey.from_string(base58))
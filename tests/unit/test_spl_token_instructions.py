@@ -1,9 +1,16 @@
 """Unit tests for SPL-token instructions."""
 
+from unittest.mock import MagicMock, patch
+
+import pytest
 import spl.token.instructions as spl_token
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.system_program import ID as SYSTEM_PROGRAM_ID
 from spl.token.constants import TOKEN_PROGRAM_ID, WRAPPED_SOL_MINT, ASSOCIATED_TOKEN_PROGRAM_ID
+from spl.token.client import Token
 from spl.token.instructions import get_associated_token_address
 
 
@@ -59,6 +66,19 @@ def test_initialize_multisig():
     assert spl_token.decode_initialize_multisig(instruction) == params
 
 
+def test_decode_initialize_multisig_without_signers():
+    """Test m == 0 decodes to no signers rather than to every account of the instruction."""
+    params = spl_token.InitializeMultisigParams(
+        program_id=TOKEN_PROGRAM_ID,
+        multisig=Pubkey([0] * 31 + [0]),
+        signers=[],
+        m=0,
+    )
+    instruction = spl_token.initialize_multisig(params)
+    assert len(instruction.accounts) == 2
+    assert spl_token.decode_initialize_multisig(instruction) == params
+
+
 def test_transfer(stubbed_receiver, stubbed_sender):
     """Test transfer."""
     params = spl_token.TransferParams(
@@ -82,6 +102,11 @@ def test_transfer(stubbed_receiver, stubbed_sender):
     instruction = spl_token.transfer(multisig_params)
     assert spl_token.decode_transfer(instruction) == multisig_params
 
+    with pytest.raises(ValueError, match="instruction index mismatch"):
+        spl_token.decode_approve(instruction)
+    with pytest.raises(ValueError, match="found 2 keys, expected at least 3"):
+        spl_token.decode_transfer(Instruction(instruction.program_id, instruction.data, instruction.accounts[:2]))
+
 
 def test_approve(stubbed_sender):
     """Test approve."""
@@ -303,6 +328,25 @@ def test_transfer_checked(stubbed_receiver, stubbed_sender):
     assert spl_token.decode_transfer_checked(instruction) == multisig_params
 
 
+def test_decode_client_built_keypair_authority_transfers():
+    """Test client-built transfers for a keypair owner decode with the owner as signer and no multisig signers."""
+    owner = Keypair()
+    token = Token(MagicMock(), Pubkey.new_unique(), TOKEN_PROGRAM_ID, Keypair())
+    source, dest = Pubkey.new_unique(), Pubkey.new_unique()
+
+    with patch("spl.token.core._build_tx") as build_tx:
+        token.transfer(source, dest, owner, 5, recent_blockhash=Hash.default())
+        token.transfer_checked(source, dest, owner, 5, 6, None, recent_blockhash=Hash.default())
+
+    (transfer_ix,), (transfer_checked_ix,) = (call.args[0] for call in build_tx.call_args_list)
+    decoded = spl_token.decode_transfer(transfer_ix)
+    assert (decoded.source, decoded.dest, decoded.owner, decoded.signers) == (source, dest, owner.pubkey(), [])
+    assert transfer_ix.accounts[2].is_signer
+    decoded_checked = spl_token.decode_transfer_checked(transfer_checked_ix)
+    assert (decoded_checked.owner, decoded_checked.signers, decoded_checked.decimals) == (owner.pubkey(), [], 6)
+    assert transfer_checked_ix.accounts[3].is_signer
+
+
 def test_approve_checked(stubbed_receiver, stubbed_sender):
     """Test approve_checked."""
     mint = Pubkey([0] * 31 + [0])
@@ -427,3 +471,34 @@ def test_create_idempotent_token_account(stubbed_receiver, stubbed_sender):
     assert instruction.accounts[5].pubkey == TOKEN_PROGRAM_ID
     assert not instruction.accounts[5].is_signer
     assert not instruction.accounts[5].is_writable
+
+
+def test_decode_batch(stubbed_receiver, stubbed_sender):
+    """Test decoding a batch of mixed instructions."""
+    transfer_params = spl_token.TransferParams(
+        program_id=TOKEN_PROGRAM_ID,
+        source=stubbed_sender.pubkey(),
+        dest=stubbed_receiver,
+        owner=stubbed_sender.pubkey(),
+        amount=123,
+    )
+    burn_params = spl_token.BurnCheckedParams(
+        program_id=TOKEN_PROGRAM_ID,
+        account=stubbed_sender.pubkey(),
+        mint=stubbed_receiver,
+        owner=stubbed_sender.pubkey(),
+        amount=5,
+        decimals=6,
+    )
+    sync_params = spl_token.SyncNativeParams(program_id=TOKEN_PROGRAM_ID, account=stubbed_sender.pubkey())
+    instructions = [
+        spl_token.transfer(transfer_params),
+        spl_token.burn_checked(burn_params),
+        spl_token.sync_native(sync_params),
+    ]
+    assert spl_token.decode_batch(instructions) == [transfer_params, burn_params, sync_params]
+    assert spl_token.decode_batch([]) == []
+
+    unsupported = Instruction(TOKEN_PROGRAM_ID, bytes([16]), instructions[0].accounts)
+    with pytest.raises(ValueError, match="unsupported instruction type 16"):
+        spl_token.decode_batch([*instructions, unsupported])